@@ -1,6 +1,7 @@
 """Production-ready Flask application factory"""
 
 import os
+import time
 import logging
 from typing import Optional, Dict, Any
 from flask import Flask, jsonify, request
@@ -11,6 +12,7 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_talisman import Talisman
 from flask_caching import Cache
+from flask_compress import Compress
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -19,11 +21,13 @@ load_dotenv()
 # Import database and configuration
 from backend.database import db, migrate, init_database
 from backend.config import get_config
+from backend.json_provider import OrjsonProvider
 
 # Initialize extensions
 ma = Marshmallow()
 jwt = JWTManager()
 cache = Cache()
+compress = Compress()
 
 # Initialize limiter with fallback
 try:
@@ -115,9 +119,67 @@ class Config:
         }
 
 
+def init_rate_limit_responses(app: Flask) -> None:
+    """Register 429 handling and the local short-circuit for known-limited clients
+
+    Must run before limiter.init_app() so the short-circuit is checked
+    ahead of Flask-Limiter's storage hit.
+    """
+    from backend.utils.rate_limit import rate_limit_key, remember_denial, denial_retry_after
+
+    def denial_key() -> str:
+        return rate_limit_key(f"{get_remote_address()}:{request.endpoint}")
+
+    def rate_limited(retry_after: int):
+        response = jsonify({'error': 'Rate limit exceeded', 'code': 'rate_limited'})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(retry_after)
+        return response
+
+    @app.before_request
+    def reject_known_rate_limited():
+        retry_after = denial_retry_after(denial_key())
+        if retry_after:
+            return rate_limited(retry_after)
+
+    @app.errorhandler(429)
+    def too_many_requests(error):
+        current_limit = getattr(limiter, 'current_limit', None)
+        reset_at = current_limit.reset_at if current_limit else time.time() + 1
+        remember_denial(denial_key(), reset_at)
+        return rate_limited(max(int(reset_at - time.time()), 0) + 1)
+
+
+def init_conditional_get(app: Flask) -> None:
+    """Tag successful JSON GET responses with an ETag and answer If-None-Match with 304
+
+    Also initializes Flask-Compress, between the two hooks: after_request
+    hooks run in reverse order, so the ETag is computed on the plain body,
+    Flask-Compress then suffixes it (e.g. '"<hash>:gzip"'), and the 304 check
+    runs last against the tag the client actually received.
+    """
+
+    @app.after_request
+    def answer_conditional(response):
+        if request.method == 'GET' and response.status_code == 200 and 'ETag' in response.headers:
+            response.make_conditional(request)
+        return response
+
+    compress.init_app(app)
+
+    @app.after_request
+    def add_etag(response):
+        if (request.method == 'GET' and response.status_code == 200
+                and response.mimetype == 'application/json'
+                and not response.direct_passthrough):
+            response.add_etag()
+        return response
+
+
 def create_app(config_name: str = None) -> Flask:
     """Production-ready application factory"""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Load configuration based on environment
     config_class = get_config(config_name)
@@ -133,6 +195,8 @@ def create_app(config_name: str = None) -> Flask:
     ma.init_app(app)
     jwt.init_app(app)
     cache.init_app(app)
+    init_conditional_get(app)
+    init_rate_limit_responses(app)
     limiter.init_app(app)
     
     # CORS Configuration
@@ -174,6 +238,7 @@ def create_app(config_name: str = None) -> Flask:
     from backend.routes.billing import billing_bp
     from backend.routes.telemedicine import telemedicine_bp
     from backend.routes.analytics import analytics_bp
+    from backend.routes.batch import batch_bp
 
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(clients_bp, url_prefix='/api/clients')
@@ -190,6 +255,7 @@ def create_app(config_name: str = None) -> Flask:
     app.register_blueprint(billing_bp, url_prefix='/api')
     app.register_blueprint(telemedicine_bp, url_prefix='/api/telemedicine')
     app.register_blueprint(analytics_bp, url_prefix='/api/analytics')
+    app.register_blueprint(batch_bp, url_prefix='/api')
 
     # Error handlers
     @app.errorhandler(400)
@@ -208,6 +274,16 @@ def create_app(config_name: str = None) -> Flask:
     def not_found(error):
         return jsonify({'error': 'Not found'}), 404
 
+    from backend.utils.helpers import PaginationTooDeepError
+
+    @app.errorhandler(PaginationTooDeepError)
+    def pagination_too_deep(error):
+        return jsonify({
+            'error': str(error),
+            'use': 'cursor',
+            'cursor_url': f'{request.base_url}?cursor='
+        }), 400
+
     @app.errorhandler(500)
     def internal_error(error):
         db.session.rollback()
@@ -82,8 +82,6 @@ class Config:
             'JWT_SECRET_KEY': Config.get('JWT_SECRET_KEY'),
             'JWT_ACCESS_TOKEN_EXPIRES': Config.get_int('JWT_ACCESS_TOKEN_EXPIRES', 3600),
             'JWT_REFRESH_TOKEN_EXPIRES': Config.get_int('JWT_REFRESH_TOKEN_EXPIRES', 86400),
-            'PASSWORD_HASH_SCHEME': Config.get('PASSWORD_HASH_SCHEME', 'pbkdf2:sha256'),
-            'PASSWORD_SALT_LENGTH': Config.get_int('PASSWORD_SALT_LENGTH', 32),
             'DEFAULT_ADMIN_USERNAME': Config.get('DEFAULT_ADMIN_USERNAME', 'admin'),
             'DEFAULT_ADMIN_EMAIL': Config.get('DEFAULT_ADMIN_EMAIL', 'admin@healthsystem.org'),
             'DEFAULT_ADMIN_PASSWORD': Config.get('DEFAULT_ADMIN_PASSWORD'),
@@ -36,11 +36,27 @@ class BaseConfig:
     # Redis Configuration (for rate limiting and caching)
     REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
     
+    # Caching (Redis when REDIS_URL is set, otherwise per-process memory)
+    CACHE_TYPE = os.getenv('CACHE_TYPE', 'RedisCache' if os.getenv('REDIS_URL') else 'SimpleCache')
+    CACHE_REDIS_URL = REDIS_URL
+    CACHE_DEFAULT_TIMEOUT = 300
+    
+    # Socket.IO message queue shared by workers (e.g. redis://...); None for a single process
+    SOCKETIO_MESSAGE_QUEUE = os.getenv('SOCKETIO_MESSAGE_QUEUE')
+    
     # Rate Limiting
     RATELIMIT_STORAGE_URL = os.getenv('REDIS_URL', 'memory://')
+    RATELIMIT_STORAGE_URI = RATELIMIT_STORAGE_URL
+    # Sliding log; on Redis each hit is one atomic EVALSHA of a preloaded Lua script
+    RATELIMIT_STRATEGY = 'moving-window'
     RATELIMIT_DEFAULT = os.getenv('RATE_LIMIT_DEFAULT', '1000 per hour')
     RATELIMIT_HEADERS_ENABLED = True
     
+    # Response compression (Flask-Compress); urllib3 on the Django side decodes gzip natively
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_ALGORITHM = 'gzip'
+    COMPRESS_MIN_SIZE = 1024
+    
     # CORS Configuration
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*').split(',')
     CORS_SUPPORTS_CREDENTIALS = True
@@ -53,7 +69,7 @@ class BaseConfig:
     # File Upload Configuration
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
-    ALLOWED_EXTENSIONS = {'txt', 'pdf', 'png', 'jpg', 'jpeg', 'gif', 'doc', 'docx'}
+    ALLOWED_EXTENSIONS = frozenset({'txt', 'pdf', 'png', 'jpg', 'jpeg', 'gif', 'doc', 'docx'})
     
     # Email Configuration
     MAIL_SERVER = os.getenv('MAIL_SERVER')
@@ -1,9 +1,9 @@
 import sys
 from datetime import date
-from werkzeug.security import generate_password_hash
 from backend import db, create_app
 from backend.models import User, Client, Program
 from backend.config import Config
+from backend.utils.helpers import generate_secure_hash
 import logging
 from typing import List, Dict, Any
 
@@ -54,11 +54,7 @@ def create_admin_user() -> bool:
         logger.warning("No admin password set in environment. Using default (change in production!)")
         admin_password = 'admin123'  # This should be changed immediately after setup
 
-    hashed_password = generate_password_hash(
-        admin_password,
-        method=Config.get('PASSWORD_HASH_SCHEME', 'pbkdf2:sha256'),
-        salt_length=Config.get_int('PASSWORD_SALT_LENGTH', 16)
-    )
+    hashed_password = generate_secure_hash(admin_password)
 
     admin = User(
         username=admin_username,
@@ -0,0 +1,67 @@
+"""
+orjson-backed JSON encoding for Flask responses and Socket.IO packets
+"""
+
+import json
+
+from flask.json.provider import DefaultJSONProvider, _default
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None
+
+
+def _orjson_default(obj):
+    """Encode the types orjson leaves to the caller (Decimal, sets, ...)"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return _default(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson when it is installed
+
+    datetime, date and UUID values are emitted by orjson as ISO 8601 strings;
+    anything else it cannot encode natively goes through Flask's default hook.
+    """
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_orjson_default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        if orjson is None or pretty:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps(obj), mimetype=self.mimetype)
+
+
+class SocketIOJSON:
+    """json-module shim passed to SocketIO(json=...)
+
+    python-socketio calls dumps()/loads() with stdlib keyword arguments
+    (separators, ...); orjson output is already compact so they are ignored.
+    """
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        if orjson is None:
+            return json.dumps(obj, *args, default=_orjson_default, **kwargs)
+        return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        if orjson is None:
+            return json.loads(s, *args, **kwargs)
+        return orjson.loads(s)
@@ -8,10 +8,13 @@ from werkzeug.security import generate_password_hash
 import secrets
 
 
+_EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+_PHONE_REGEX = re.compile(r'^\+?[0-9]{7,15}$')
+
+
 def validate_email(email):
     """Validate email format using regex."""
-    pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_REGEX.match(email) is not None
 
 
 class User(db.Model):
@@ -69,6 +72,11 @@ class Client(db.Model):
     visits = db.relationship('Visit', backref='client', lazy=True, cascade='all, delete-orphan')
     appointments = db.relationship('Appointment', backref='client', lazy=True, cascade='all, delete-orphan')
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_clients_created_at_id', 'created_at', 'id'),
+    )
+
 
 class Program(db.Model):
     """Program model representing health programs."""
@@ -429,6 +437,10 @@ class Admission(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Relationships
+    client = db.relationship('Client', lazy=True)
+    attending_doctor = db.relationship('Staff', lazy=True, foreign_keys=[attending_doctor_id])
+
 
 class Billing(db.Model):
     """Billing model for patient billing and invoicing."""
@@ -546,7 +558,7 @@ def validate_client(mapper, connection, target):
     """Validate client fields before insert or update."""
     if target.gender not in Client.GENDERS:
         raise ValueError(f"Invalid gender. Must be one of: {', '.join(Client.GENDERS)}")
-    if target.phone and not re.match(r'^\+?[0-9]{7,15}$', target.phone):
+    if target.phone and not _PHONE_REGEX.match(target.phone):
         raise ValueError("Invalid phone number format. Expected format: +1234567890 or 1234567890.")
 
 
@@ -26,8 +26,8 @@ def get_admissions():
         admission_type = request.args.get('admission_type')
         date_from = request.args.get('date_from')
         date_to = request.args.get('date_to')
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         query = Admission.query
         
@@ -63,7 +63,12 @@ def get_admissions():
                 'reason': admission.reason,
                 'diagnosis': admission.diagnosis,
                 'total_cost': float(admission.total_cost) if admission.total_cost else None,
-                'created_at': admission.created_at.isoformat()
+                'created_at': admission.created_at.isoformat(),
+                'updated_at': admission.updated_at.isoformat() if admission.updated_at else None,
+                # Versions of the joined rows, so cached list rows refresh when they change
+                'client_updated_at': admission.client.updated_at.isoformat() if admission.client and admission.client.updated_at else None,
+                'bed_updated_at': admission.bed.updated_at.isoformat() if admission.bed and admission.bed.updated_at else None,
+                'attending_doctor_updated_at': admission.attending_doctor.updated_at.isoformat() if admission.attending_doctor and admission.attending_doctor.updated_at else None
             }
             result.append(admission_data)
         
@@ -313,8 +318,8 @@ def get_beds():
         bed_type = request.args.get('bed_type')
         status = request.args.get('status')
         is_active = request.args.get('is_active', 'true').lower() == 'true'
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         query = Bed.query.filter_by(is_active=is_active)
         
@@ -463,8 +468,8 @@ def get_client_admissions(client_id):
         # Verify client exists
         client = Client.query.get_or_404(client_id)
         
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         admissions = Admission.query.filter_by(client_id=client_id)\
             .order_by(Admission.admission_date.desc())\
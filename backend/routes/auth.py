@@ -1,13 +1,15 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify
 from backend import db, jwt
 from backend.models import User
-from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timedelta
 import jwt as pyjwt
 from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity, jwt_required
 from backend.schemas import user_schema
 from backend.utils.auth import token_required, admin_required
-from backend.utils.helpers import validate_email, validate_password
+from backend.utils.helpers import (
+    validate_email, validate_password, generate_secure_hash,
+    verify_secure_hash, password_needs_rehash
+)
 from backend import limiter
 import logging
 
@@ -49,11 +51,7 @@ def register(current_user):
             }), 400
 
         # Create new user
-        hashed_password = generate_password_hash(
-            data['password'],
-            method=current_app.config['PASSWORD_HASH_SCHEME'],
-            salt_length=current_app.config['PASSWORD_SALT_LENGTH']
-        )
+        hashed_password = generate_secure_hash(data['password'])
 
         new_user = User(
             username=data['username'],
@@ -89,12 +87,17 @@ def login():
             return jsonify({'error': 'Username and password required'}), 400
 
         user = User.query.filter_by(username=data['username']).first()
-        if not user or not check_password_hash(user.password, data['password']):
+        if not user or not verify_secure_hash(user.password, data['password']):
             return jsonify({'error': 'Invalid credentials'}), 401
 
         if not user.is_active:
             return jsonify({'error': 'Account disabled'}), 403
 
+        # Upgrade legacy pbkdf2 hashes to argon2 on successful login
+        if password_needs_rehash(user.password):
+            user.password = generate_secure_hash(data['password'])
+            db.session.commit()
+
         # Use Flask-JWT-Extended's token creation
         access_token = create_access_token(
             identity=user.id,
@@ -0,0 +1,83 @@
+from urllib.parse import urlsplit
+from flask import Blueprint, current_app, jsonify, request
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import RequestRedirect
+from backend import db
+from backend.utils.auth import token_required
+
+batch_bp = Blueprint('batch', __name__)
+
+# Upper bound on sub-requests per batch call
+MAX_BATCH_REQUESTS = 10
+
+# Caller headers carried into each sub-request (auth, client identity for rate limiting)
+_FORWARDED_HEADERS = ('Authorization', 'X-Forwarded-For', 'X-Real-IP', 'User-Agent')
+
+
+def _canonical_path(app, path):
+    """Resolve path through the URL map, following strict-slash redirects
+
+    full_dispatch_request would answer 'clients' with a 308 to 'clients/';
+    the rewritten path is dispatched instead.
+    """
+    path_info, _, query = path.partition('?')
+    try:
+        app.url_map.bind('localhost').match(path_info, method='GET', query_args=query)
+    except RequestRedirect as redirect:
+        target = urlsplit(redirect.new_url)
+        return f'{target.path}?{target.query}' if target.query else target.path
+    except HTTPException:
+        pass  # 404/405 are reported by the dispatch itself
+    return path
+
+
+@batch_bp.route('/batch', methods=['POST'])
+@token_required
+def batch(current_user):
+    """Run several read-only API calls in one HTTP round-trip
+
+    Each sub-request is dispatched through the normal routing, auth and
+    error handling with the caller's Authorization header, and carries its
+    own status in the response so partial failures are reported per item.
+    """
+    data = request.get_json(silent=True) or {}
+    specs = data.get('requests')
+
+    if not isinstance(specs, list) or not specs:
+        return jsonify({'error': 'requests must be a non-empty list'}), 400
+    if len(specs) > MAX_BATCH_REQUESTS:
+        return jsonify({'error': f'A batch may contain at most {MAX_BATCH_REQUESTS} requests'}), 400
+
+    # Each sub-request runs in its own app context, and so its own session;
+    # return this request's connection to the pool before dispatching them
+    db.session.remove()
+
+    headers = {name: request.headers[name] for name in _FORWARDED_HEADERS if name in request.headers}
+    environ_base = {'REMOTE_ADDR': request.remote_addr}
+    responses = []
+
+    for spec in specs:
+        if not isinstance(spec, dict) or not isinstance(spec.get('endpoint'), str):
+            responses.append({'status': 400, 'body': {'error': 'Each request needs an endpoint'}})
+            continue
+        if str(spec.get('method', 'GET')).upper() != 'GET':
+            responses.append({'status': 405, 'body': {'error': 'Only GET requests can be batched'}})
+            continue
+
+        path = f"/api/{spec['endpoint'].lstrip('/')}"
+        if path.split('?', 1)[0].rstrip('/') == '/api/batch':
+            responses.append({'status': 400, 'body': {'error': 'Batches cannot be nested'}})
+            continue
+
+        # A fresh app context gives each sub-request its own flask.g
+        app = current_app._get_current_object()
+        path = _canonical_path(app, path)
+        with app.app_context(), app.test_request_context(
+                path, method='GET', headers=headers, environ_base=environ_base):
+            response = app.full_dispatch_request()
+        responses.append({
+            'status': response.status_code,
+            'body': response.get_json(silent=True)
+        })
+
+    return jsonify({'responses': responses}), 200
@@ -2,11 +2,12 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from backend.database import db
 from backend.models import Billing, BillingItem, Client, Visit, Admission, InsuranceProvider, ClientInsurance
-from backend.utils.helpers import handle_validation_error
+from backend.utils.helpers import handle_validation_error, get_current_date
 from backend.utils.auth import role_required
 from datetime import datetime, date
 import logging
-import uuid
+import secrets
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,8 +29,8 @@ def get_billings():
         date_from = request.args.get('date_from')
         date_to = request.args.get('date_to')
         overdue = request.args.get('overdue') == 'true'
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         query = Billing.query
         
@@ -44,7 +45,7 @@ def get_billings():
         if date_to:
             query = query.filter(Billing.created_at <= datetime.strptime(date_to, '%Y-%m-%d'))
         if overdue:
-            today = datetime.utcnow().date()
+            today = get_current_date()
             query = query.filter(Billing.due_date < today, Billing.status.in_(['pending', 'partially_paid']))
         
         billings = query.order_by(Billing.created_at.desc()).paginate(
@@ -69,7 +70,7 @@ def get_billings():
                 'due_date': billing.due_date.isoformat() if billing.due_date else None,
                 'payment_date': billing.payment_date.isoformat() if billing.payment_date else None,
                 'created_at': billing.created_at.isoformat(),
-                'is_overdue': billing.due_date < datetime.utcnow().date() if billing.due_date else False
+                'is_overdue': billing.due_date < get_current_date() if billing.due_date else False
             }
             result.append(billing_data)
         
@@ -109,7 +110,7 @@ def create_billing():
         client = Client.query.get_or_404(data['client_id'])
         
         # Generate invoice number
-        invoice_number = f"INV-{datetime.utcnow().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
+        invoice_number = f"INV-{time.strftime('%Y%m%d', time.gmtime())}-{secrets.token_hex(4).upper()}"
         
         # Create billing record
         billing = Billing(
@@ -316,8 +317,8 @@ def get_client_billing(client_id):
         # Verify client exists
         client = Client.query.get_or_404(client_id)
         
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         billings = Billing.query.filter_by(client_id=client_id)\
             .order_by(Billing.created_at.desc())\
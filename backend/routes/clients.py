@@ -3,8 +3,12 @@ from backend import db
 from backend.models import Client, ClientProgram, Program
 from backend.schemas import client_schema, clients_schema, client_programs_schema
 from backend.utils.auth import token_required, roles_required
-from backend.utils.helpers import parse_date, validate_phone, validate_email
+from backend.utils.helpers import (
+    parse_date, validate_phone, validate_email, paginate_keyset, paginate_query_cached,
+    PaginationTooDeepError
+)
 from datetime import datetime
+from urllib.parse import urlencode
 from sqlalchemy import or_, and_
 
 clients_bp = Blueprint('clients', __name__)
@@ -30,6 +34,7 @@ def get_clients(current_user):
             query = query.filter(or_(
                 Client.first_name.ilike(f'%{search_query}%'),
                 Client.last_name.ilike(f'%{search_query}%'),
+                (Client.first_name + ' ' + Client.last_name).ilike(f'%{search_query}%'),
                 Client.phone.ilike(f'%{search_query}%'),
                 Client.email.ilike(f'%{search_query}%')
             ))
@@ -49,35 +54,61 @@ def get_clients(current_user):
                 min_dob = today.replace(year=today.year - max_age - 1)
                 query = query.filter(Client.dob > min_dob)
 
+        # Keyset pagination when a cursor is supplied (an empty cursor starts at the first page)
+        cursor = request.args.get('cursor')
+        if cursor is not None:
+            try:
+                page_data = paginate_keyset(
+                    query,
+                    [Client.created_at, Client.id],
+                    cursor=cursor,
+                    limit=per_page,
+                    descending=True
+                )
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+
+            response = jsonify({
+                'data': _dump_clients(page_data['items']),
+                'next_cursor': page_data['next_cursor'],
+                'has_next': page_data['has_next'],
+                'per_page': page_data['per_page']
+            })
+            if page_data['next_cursor']:
+                args = request.args.to_dict()
+                args['cursor'] = page_data['next_cursor']
+                response.headers['Link'] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+            return response, 200
+
         # Order by creation date (newest first)
         query = query.order_by(Client.created_at.desc())
 
-        # Pagination
-        paginated_clients = query.paginate(page=page, per_page=per_page, error_out=False)
-
-        # Calculate age for each client
-        clients_data = []
-        for client in paginated_clients.items:
-            client_dict = client_schema.dump(client)
-            if client.dob:
-                age = (datetime.utcnow().date() - client.dob).days // 365
-                client_dict['age'] = age
-            else:
-                client_dict['age'] = None
-            clients_data.append(client_dict)
+        # Pagination (serialized pages, with ages, are cached until clients change)
+        page_data = paginate_query_cached(query, page, per_page, _dump_clients, 'clients')
 
         return jsonify({
-            'data': clients_data,
-            'total': paginated_clients.total,
-            'pages': paginated_clients.pages,
-            'current_page': paginated_clients.page,
+            'data': page_data['items'],
+            'total': page_data['total'],
+            'pages': page_data['pages'],
+            'current_page': page_data['current_page'],
             'per_page': per_page
         }), 200
 
+    except PaginationTooDeepError:
+        raise  # answered by the app-wide handler with a pointer to cursor pagination
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _dump_clients(clients):
+    """Serialize a page of clients in one schema pass and attach computed ages"""
+    today = datetime.utcnow().date()
+    clients_data = clients_schema.dump(clients)
+    for client, client_dict in zip(clients, clients_data):
+        client_dict['age'] = (today - client.dob).days // 365 if client.dob else None
+    return clients_data
+
+
 @clients_bp.route('/', methods=['POST'])
 @roles_required('admin', 'doctor', 'nurse', 'receptionist')
 def create_client(current_user):
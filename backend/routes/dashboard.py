@@ -126,8 +126,8 @@ def get_appointments():
         # Get query parameters
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
-        per_page = int(request.args.get('per_page', 10))
-        page = int(request.args.get('page', 1))
+        per_page = request.args.get('per_page', 10, type=int)
+        page = request.args.get('page', 1, type=int)
 
         # Build query
         query = Appointment.query
@@ -186,8 +186,8 @@ def get_visits():
         # Get query parameters
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
-        per_page = int(request.args.get('per_page', 10))
-        page = int(request.args.get('page', 1))
+        per_page = request.args.get('per_page', 10, type=int)
+        page = request.args.get('page', 1, type=int)
 
         # Build query
         query = Visit.query
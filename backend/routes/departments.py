@@ -22,8 +22,8 @@ def get_all_departments():
         # Get query parameters
         is_active = request.args.get('is_active', 'true').lower() == 'true'
         search = request.args.get('search', '').strip()
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 10)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 10, type=int), 100)
         
         # Build query
         query = Department.query
@@ -304,8 +304,8 @@ def get_department_staff(department_id):
         
         # Get query parameters
         is_active = request.args.get('is_active', 'true').lower() == 'true'
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 10)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 10, type=int), 100)
         
         # Build query
         query = Staff.query.filter_by(department_id=department_id)
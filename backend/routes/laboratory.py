@@ -22,8 +22,8 @@ def get_lab_tests():
     try:
         category = request.args.get('category')
         is_active = request.args.get('is_active', 'true').lower() == 'true'
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         query = LabTest.query.filter_by(is_active=is_active)
         
@@ -179,8 +179,8 @@ def get_lab_orders():
         priority = request.args.get('priority')
         date_from = request.args.get('date_from')
         date_to = request.args.get('date_to')
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         query = LabOrder.query
         
@@ -394,8 +394,8 @@ def get_client_lab_orders(client_id):
         # Verify client exists
         client = Client.query.get_or_404(client_id)
         
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         orders = LabOrder.query.filter_by(client_id=client_id)\
             .order_by(LabOrder.created_at.desc())\
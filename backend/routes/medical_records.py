@@ -21,8 +21,8 @@ def get_all_medical_records():
     """Get all medical records with optional filtering."""
     try:
         client_id = request.args.get('client_id')
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 10)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 10, type=int), 100)
         
         query = MedicalRecord.query
         
@@ -65,8 +65,8 @@ def get_client_medical_records(client_id):
         # Verify client exists
         client = Client.query.get_or_404(client_id)
         
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 10)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 10, type=int), 100)
         
         records = MedicalRecord.query.filter_by(client_id=client_id)\
             .order_by(MedicalRecord.created_at.desc())\
@@ -260,8 +260,8 @@ def get_client_vital_signs(client_id):
         # Verify client exists
         client = Client.query.get_or_404(client_id)
         
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         vitals = VitalSigns.query.filter_by(client_id=client_id)\
             .order_by(VitalSigns.recorded_at.desc())\
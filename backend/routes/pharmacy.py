@@ -27,8 +27,8 @@ def get_prescriptions():
         date_from = request.args.get('date_from')
         date_to = request.args.get('date_to')
         dispensed = request.args.get('dispensed')
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         query = Prescription.query
         
@@ -303,8 +303,8 @@ def get_client_prescriptions(client_id):
         # Verify client exists
         client = Client.query.get_or_404(client_id)
         
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         prescriptions = Prescription.query.filter_by(client_id=client_id)\
             .order_by(Prescription.prescribed_date.desc())\
@@ -358,8 +358,8 @@ def get_inventory():
         low_stock = request.args.get('low_stock') == 'true'
         expiring_soon = request.args.get('expiring_soon') == 'true'
         is_active = request.args.get('is_active', 'true').lower() == 'true'
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 20)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
         
         query = Inventory.query.filter_by(is_active=is_active)
         
@@ -25,8 +25,8 @@ def get_all_staff():
         specialization = request.args.get('specialization')
         employment_type = request.args.get('employment_type')
         is_active = request.args.get('is_active', 'true').lower() == 'true'
-        page = int(request.args.get('page', 1))
-        per_page = min(int(request.args.get('per_page', 10)), 100)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 10, type=int), 100)
         
         # Build query
         query = Staff.query
@@ -61,7 +61,10 @@ def get_all_staff():
                 'employment_type': staff.employment_type,
                 'hire_date': staff.hire_date.isoformat() if staff.hire_date else None,
                 'is_active': staff.is_active,
-                'created_at': staff.created_at.isoformat()
+                'created_at': staff.created_at.isoformat(),
+                'updated_at': staff.updated_at.isoformat() if staff.updated_at else None,
+                # Version of the joined department, so cached list rows refresh when it changes
+                'department_updated_at': staff.department.updated_at.isoformat() if staff.department and staff.department.updated_at else None
             }
             result.append(staff_data)
         
@@ -27,6 +27,12 @@ import logging
 security_logger = logging.getLogger('security')
 security_logger.setLevel(logging.INFO)
 
+# Password policy character-class checks (single-class patterns, linear time)
+_UPPERCASE_REGEX = re.compile(r'[A-Z]')
+_LOWERCASE_REGEX = re.compile(r'[a-z]')
+_DIGIT_REGEX = re.compile(r'\d')
+_SPECIAL_CHAR_REGEX = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
 class SecurityEventType(Enum):
     """Security event types for audit logging"""
     LOGIN_SUCCESS = "login_success"
@@ -127,16 +133,16 @@ class PasswordPolicy:
         if len(password) < cls.MIN_LENGTH:
             errors.append(f"Password must be at least {cls.MIN_LENGTH} characters long")
         
-        if cls.REQUIRE_UPPERCASE and not re.search(r'[A-Z]', password):
+        if cls.REQUIRE_UPPERCASE and not _UPPERCASE_REGEX.search(password):
             errors.append("Password must contain at least one uppercase letter")
         
-        if cls.REQUIRE_LOWERCASE and not re.search(r'[a-z]', password):
+        if cls.REQUIRE_LOWERCASE and not _LOWERCASE_REGEX.search(password):
             errors.append("Password must contain at least one lowercase letter")
         
-        if cls.REQUIRE_NUMBERS and not re.search(r'\d', password):
+        if cls.REQUIRE_NUMBERS and not _DIGIT_REGEX.search(password):
             errors.append("Password must contain at least one number")
         
-        if cls.REQUIRE_SPECIAL_CHARS and not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+        if cls.REQUIRE_SPECIAL_CHARS and not _SPECIAL_CHAR_REGEX.search(password):
             errors.append("Password must contain at least one special character")
         
         # Check for consecutive characters
@@ -1,7 +1,7 @@
 """Backend utilities package"""
 
 from .auth import role_required, token_required, admin_required
-from .helpers import handle_validation_error, paginate_query
+from .helpers import handle_validation_error, paginate_query, paginate_query_cached, paginate_keyset
 from .rate_limit import rate_limit_key
 
 __all__ = [
@@ -10,5 +10,7 @@ __all__ = [
     'admin_required',
     'handle_validation_error',
     'paginate_query',
+    'paginate_query_cached',
+    'paginate_keyset',
     'rate_limit_key'
 ]
@@ -1,61 +1,122 @@
+import base64
+import hashlib
+import itertools
+import json
 import re
-from datetime import datetime
-from dateutil.parser import parse
-from werkzeug.security import generate_password_hash
-from flask import current_app
+import string
+from datetime import date, datetime
+from dateutil.parser import parse, isoparse
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from werkzeug.security import check_password_hash
+from flask import current_app, g, has_app_context, has_request_context
+from sqlalchemy import event, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import find_tables
+
+_DIGITS = frozenset(string.digits)
+_LETTERS = frozenset(string.ascii_letters)
+
+_PASSWORD_HASHER = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+
+# Deepest row offset served by offset pagination; deeper pages must use a cursor
+MAX_PAGINATION_OFFSET = 10000
+
+# Seconds a serialized list page is served from cache before it is recomputed
+QUERY_CACHE_TIMEOUT = 30
+
+_EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+# Basic international phone validation
+_PHONE_REGEX = re.compile(r'^\+?[0-9\s\-\(\)]{7,20}$')
+# Allow letters, spaces, hyphens, and apostrophes
+_NAME_REGEX = re.compile(r"^[a-zA-Z\s\-']+$")
 
 def validate_email(email):
     """Validate email format"""
     if not email or not isinstance(email, str):
         return False
-    pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_REGEX.match(email) is not None
 
 def validate_phone(phone):
     """Validate phone number format"""
     if not phone or not isinstance(phone, str):
         return False
-    # Basic international phone validation
-    pattern = r'^\+?[0-9\s\-\(\)]{7,20}$'
-    return re.match(pattern, phone) is not None
+    # Reject on length before running the pattern: 7-20 chars plus an optional '+'
+    if not 7 <= len(phone) <= 21:
+        return False
+    return _PHONE_REGEX.match(phone) is not None
 
 def validate_password(password):
     """Validate password complexity"""
     if not password or len(password) < 8:
         return False
     # At least one digit, one letter, and one special character
-    return bool(re.search(r'\d', password)) and \
-           bool(re.search(r'[A-Za-z]', password)) and \
-           bool(re.search(r'[^A-Za-z0-9]', password))
+    has_digit = has_letter = has_special = False
+    for char in password:
+        if char in _DIGITS:
+            has_digit = True
+        elif char in _LETTERS:
+            has_letter = True
+        else:
+            has_special = True
+        if has_digit and has_letter and has_special:
+            return True
+    return False
 
 def validate_name(name):
     """Validate person or program name"""
     if not name or not isinstance(name, str) or len(name.strip()) < 2:
         return False
-    # Allow letters, spaces, hyphens, and apostrophes
-    return bool(re.match(r"^[a-zA-Z\s\-']+$", name))
+    return _NAME_REGEX.match(name) is not None
 
-def parse_date(date_str, format='%Y-%m-%d'):
+def _detect_date_format(value):
+    """Pick a strptime format from the shape of a date string, or None"""
+    length = len(value)
+    if length >= 10 and value[4] == '-' and value[7] == '-':
+        if length == 10:
+            return '%Y-%m-%d'
+        if length == 19:
+            return '%Y-%m-%dT%H:%M:%S' if value[10] == 'T' else '%Y-%m-%d %H:%M:%S'
+        return None
+    if length == 10 and value[2] == '/' and value[5] == '/':
+        return '%m/%d/%Y'
+    return None
+
+def _parse_datetime_value(value, format=None):
+    """Parse a date/datetime string, trying the cheapest parser first
+
+    A given or detected strptime format is tried first, then isoparse for
+    ISO-looking strings; anything they reject falls back to dateutil's
+    general parser (e.g. day-first '15/01/2024').
+    """
+    format = format or _detect_date_format(value)
+    if format:
+        try:
+            return datetime.strptime(value, format)
+        except ValueError:
+            pass
+    elif len(value) >= 10 and value[4] == '-':
+        try:
+            return isoparse(value)
+        except ValueError:
+            pass
+    return parse(value)
+
+def parse_date(date_str, format=None):
     """Parse date string with error handling"""
     try:
-        return datetime.strptime(date_str, format).date()
-    except (ValueError, TypeError, AttributeError):
-        try:
-            return parse(date_str).date()
-        except:
-            current_app.logger.warning(f'Failed to parse date: {date_str}')
-            return None
+        return _parse_datetime_value(date_str, format).date()
+    except (ValueError, TypeError, AttributeError, OverflowError):
+        current_app.logger.warning(f'Failed to parse date: {date_str}')
+        return None
 
-def parse_datetime(datetime_str, format='%Y-%m-%d %H:%M:%S'):
+def parse_datetime(datetime_str, format=None):
     """Parse datetime string with error handling"""
     try:
-        return datetime.strptime(datetime_str, format)
-    except (ValueError, TypeError, AttributeError):
-        try:
-            return parse(datetime_str)
-        except:
-            current_app.logger.warning(f'Failed to parse datetime: {datetime_str}')
-            return None
+        return _parse_datetime_value(datetime_str, format)
+    except (ValueError, TypeError, AttributeError, OverflowError):
+        current_app.logger.warning(f'Failed to parse datetime: {datetime_str}')
+        return None
 
 def validate_visit_type(visit_type):
     """Validate visit type against allowed values"""
@@ -64,11 +125,22 @@ def validate_visit_type(visit_type):
 
 def generate_secure_hash(password):
     """Generate secure password hash"""
-    return generate_password_hash(
-        password,
-        method='pbkdf2:sha256:600000',
-        salt_length=16
-    )
+    return _PASSWORD_HASHER.hash(password)
+
+def verify_secure_hash(password_hash, password):
+    """Check a password against an argon2 hash or a legacy werkzeug hash"""
+    if not password_hash.startswith('$argon2'):
+        return check_password_hash(password_hash, password)
+    try:
+        return _PASSWORD_HASHER.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def password_needs_rehash(password_hash):
+    """Check whether a stored hash predates the current argon2 parameters"""
+    if not password_hash.startswith('$argon2'):
+        return True
+    return _PASSWORD_HASHER.check_needs_rehash(password_hash)
 
 def handle_validation_error(error):
     """Handle validation errors and return formatted response"""
@@ -93,13 +165,37 @@ def handle_validation_error(error):
             'message': str(error)
         }), 400
 
-def paginate_query(query, page, per_page=20):
-    """Helper function to paginate database queries"""
+class PaginationTooDeepError(ValueError):
+    """Raised when an offset page lies beyond MAX_PAGINATION_OFFSET"""
+
+def paginate_query(query, page, per_page=20, include_total=True):
+    """Helper function to paginate database queries
+
+    With include_total=False the COUNT query is skipped: one extra row is
+    fetched to compute has_next, and total/pages are returned as None.
+    """
     try:
         page = int(page) if page else 1
+        page = max(page, 1)
         per_page = int(per_page) if per_page else 20
         per_page = min(per_page, 100)  # Limit maximum per_page
-        
+        if (page - 1) * per_page > MAX_PAGINATION_OFFSET:
+            raise PaginationTooDeepError(
+                f'Offset pagination is limited to {MAX_PAGINATION_OFFSET} rows; use a cursor'
+            )
+
+        if not include_total:
+            items = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+            return {
+                'items': items[:per_page],
+                'total': None,
+                'pages': None,
+                'current_page': page,
+                'per_page': per_page,
+                'has_next': len(items) > per_page,
+                'has_prev': page > 1
+            }
+
         pagination = query.paginate(
             page=page,
             per_page=per_page,
@@ -115,6 +211,8 @@ def paginate_query(query, page, per_page=20):
             'has_next': pagination.has_next,
             'has_prev': pagination.has_prev
         }
+    except PaginationTooDeepError:
+        raise
     except Exception as e:
         current_app.logger.error(f'Pagination error: {str(e)}')
         return {
@@ -127,6 +225,140 @@ def paginate_query(query, page, per_page=20):
             'has_prev': False
         }
 
+def _table_version_key(table_name):
+    return f'tblver:{table_name}'
+
+def paginate_query_cached(query, page, per_page, serialize, namespace,
+                          timeout=QUERY_CACHE_TIMEOUT, include_total=True):
+    """paginate_query with the serialized page cached for a short TTL
+
+    The cache key hashes the compiled SQL, its bound parameters and the
+    current version of every table the query reads. Committing a change to
+    any of those tables bumps its version in the shared cache backend. With
+    Redis that invalidates every worker at once; with the default per-process
+    SimpleCache only the committing worker sees the bump, and other workers
+    may serve a stale page for up to the TTL.
+    """
+    from backend import cache
+
+    statement = query.statement
+    compiled = statement.compile()
+    tables = sorted({table.name for table in find_tables(statement)})
+    versions = cache.get_many(*[_table_version_key(table) for table in tables]) if tables else []
+    fingerprint = hashlib.blake2b(
+        repr((
+            str(compiled), sorted(compiled.params.items()),
+            tables, versions, page, per_page, include_total
+        )).encode(),
+        digest_size=16
+    ).hexdigest()
+    cache_key = f'pg:{namespace}:{fingerprint}'
+
+    result = cache.get(cache_key)
+    if result is not None:
+        return result
+
+    result = paginate_query(query, page, per_page, include_total=include_total)
+    result['items'] = serialize(result['items'])
+    if result['items']:
+        cache.set(cache_key, result, timeout=timeout)
+    return result
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changed_tables(session, flush_context):
+    """Remember which tables a flush wrote so their versions bump on commit"""
+    changed = session.info.setdefault('changed_tables', set())
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        table_name = getattr(obj, '__tablename__', None)
+        if table_name:
+            changed.add(table_name)
+
+@event.listens_for(Session, 'after_commit')
+def _bump_table_versions(session):
+    """Invalidate cached list pages for every table changed by the commit"""
+    changed = session.info.pop('changed_tables', None)
+    if not changed or not has_app_context():
+        return
+    from backend import cache
+
+    for table_name in changed:
+        key = _table_version_key(table_name)
+        try:
+            # flask_caching.Cache has no inc(); use the backend's counter,
+            # seeding it first since inc() on a missing key is backend-specific
+            cache.add(key, 0, timeout=0)
+            cache.cache.inc(key)
+        except Exception as e:
+            current_app.logger.warning(f'Failed to bump cache version for {table_name}: {str(e)}')
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changed_tables(session):
+    session.info.pop('changed_tables', None)
+
+def encode_cursor(values):
+    """Encode keyset values as an opaque URL-safe cursor"""
+    raw = json.dumps(
+        list(values),
+        default=lambda v: v.isoformat() if hasattr(v, 'isoformat') else str(v),
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Decode a cursor produced by encode_cursor; raises ValueError if malformed"""
+    raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+    values = json.loads(raw)
+    # Only scalars can be bound as keyset values; nested JSON would fail in the query
+    if not isinstance(values, list) or not all(
+            value is None or isinstance(value, (str, int, float, bool)) for value in values):
+        raise ValueError('Invalid cursor')
+    return values
+
+def _cursor_value(column, value):
+    """Convert a decoded cursor value back to the column's Python type"""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type in (date, datetime) and isinstance(value, str):
+        return python_type.fromisoformat(value)
+    return value
+
+def paginate_keyset(query, columns, cursor=None, limit=20, descending=False):
+    """Keyset (cursor) pagination over one or more indexed columns
+
+    columns should end with a unique column (usually the primary key) so the
+    ordering is total. The cursor is compared as a SQL row value, so each
+    page costs O(limit) regardless of how deep it is.
+    """
+    limit = min(int(limit) if limit else 20, 100)
+    limit = max(limit, 1)
+    key = tuple_(*columns)
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(columns):
+            raise ValueError('Invalid cursor')
+        values = tuple(_cursor_value(column, value) for column, value in zip(columns, values))
+        query = query.filter(key < values if descending else key > values)
+
+    ordering = [column.desc() if descending else column.asc() for column in columns]
+    items = query.order_by(*ordering).limit(limit + 1).all()
+
+    has_next = len(items) > limit
+    items = items[:limit]
+    next_cursor = None
+    if has_next:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, column.key) for column in columns)
+
+    return {
+        'items': items,
+        'next_cursor': next_cursor,
+        'has_next': has_next,
+        'per_page': limit
+    }
+
 def format_currency(amount):
     """Format currency amount for display"""
     try:
@@ -134,10 +366,22 @@ def format_currency(amount):
     except (ValueError, TypeError):
         return "$0.00"
 
+def get_current_datetime():
+    """Get the current UTC datetime, fixed for the lifetime of a request"""
+    if not has_request_context():
+        return datetime.utcnow()
+    if 'utcnow' not in g:
+        g.utcnow = datetime.utcnow()
+    return g.utcnow
+
+def get_current_date():
+    """Get the current UTC date, fixed for the lifetime of a request"""
+    return get_current_datetime().date()
+
 def calculate_age(birth_date):
     """Calculate age from birth date"""
     try:
-        today = datetime.now().date()
+        today = date.today()
         if hasattr(birth_date, 'date'):
             birth_date = birth_date.date()
         return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
@@ -3,7 +3,41 @@ Simple rate limiting utility
 """
 
 import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# Process-local cache of clients already known to be over their limit,
+# keyed by rate_limit_key() and holding the epoch time the limit resets.
+# Ordered by insertion so the oldest denials are evicted first when full.
+_denied_until = OrderedDict()
+_denied_lock = threading.Lock()
+_MAX_DENIED_ENTRIES = 10000
 
 def rate_limit_key(identifier: str) -> str:
     """Generate rate limiting key"""
     return f"rate_limit:{hashlib.sha256(identifier.encode()).hexdigest()}"
+
+def remember_denial(key: str, reset_at: float) -> None:
+    """Record that key is rate limited until reset_at (epoch seconds)"""
+    with _denied_lock:
+        if len(_denied_until) >= _MAX_DENIED_ENTRIES:
+            now = time.time()
+            for stale in [k for k, v in _denied_until.items() if v <= now]:
+                del _denied_until[stale]
+        _denied_until[key] = reset_at
+        _denied_until.move_to_end(key)
+        while len(_denied_until) > _MAX_DENIED_ENTRIES:
+            _denied_until.popitem(last=False)
+
+def denial_retry_after(key: str) -> int:
+    """Seconds until a cached denial for key expires, or 0 if none is cached"""
+    reset_at = _denied_until.get(key)
+    if reset_at is None:
+        return 0
+    remaining = reset_at - time.time()
+    if remaining <= 0:
+        with _denied_lock:
+            _denied_until.pop(key, None)
+        return 0
+    return int(remaining) + 1
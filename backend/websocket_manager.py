@@ -3,13 +3,23 @@ WebSocket Manager for Real-time Features
 Provides real-time notifications, appointment updates, and system alerts
 """
 
+from flask import request
 from flask_socketio import SocketIO, emit, join_room, leave_room
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
 from functools import wraps
 import json
+import time
 from datetime import datetime
+from backend.json_provider import SocketIOJSON
 
-socketio = SocketIO(cors_allowed_origins="*")
+socketio = SocketIO(cors_allowed_origins="*", json=SocketIOJSON)
+
+# Verified principal per Socket.IO session: sid -> (user_id, token expiry)
+_SID_AUTH = {}
+# Re-verify the JWT when it is this close (seconds) to expiring
+_REVERIFY_MARGIN = 10
+# Room every authenticated session joins; system-wide alerts are emitted to it
+_ALL_USERS_ROOM = 'all_users'
 
 class NotificationManager:
     """Manages real-time notifications across the HMS"""
@@ -18,26 +28,37 @@ class NotificationManager:
     def authenticated_only(f):
         @wraps(f)
         def decorated(*args, **kwargs):
+            user_id, expires_at = _SID_AUTH.get(request.sid, (None, 0))
+            if user_id is not None and expires_at > time.time() + _REVERIFY_MARGIN:
+                return f(*args, **kwargs)
             try:
                 verify_jwt_in_request()
+                _SID_AUTH[request.sid] = (get_jwt_identity(), get_jwt()['exp'])
                 return f(*args, **kwargs)
             except Exception as e:
+                _SID_AUTH.pop(request.sid, None)
                 emit('error', {'message': 'Authentication required'})
                 return False
         return decorated
 
+    @staticmethod
+    def current_user_id():
+        """User id verified for the current Socket.IO session"""
+        return _SID_AUTH.get(request.sid, (None, 0))[0]
+
 @socketio.on('connect')
 @NotificationManager.authenticated_only
 def handle_connect():
     """Handle client connection"""
-    user_id = get_jwt_identity()
+    user_id = NotificationManager.current_user_id()
     join_room(f'user_{user_id}')
+    join_room(_ALL_USERS_ROOM)
     emit('connected', {'message': 'Successfully connected to real-time updates'})
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
-    user_id = get_jwt_identity()
+    user_id, _ = _SID_AUTH.pop(request.sid, (None, 0))
     if user_id:
         leave_room(f'user_{user_id}')
 
@@ -49,51 +70,72 @@ def handle_join_department(data):
     join_room(f'department_{department_id}')
     emit('joined_department', {'department_id': department_id})
 
+# Static part of each notification envelope, built once at import
+_APPOINTMENT_CREATED = {'type': 'appointment', 'action': 'created'}
+_LAB_RESULT_READY = {'type': 'lab_result', 'action': 'completed'}
+_EMERGENCY_ALERT = {'type': 'emergency', 'priority': 'high'}
+_PRESCRIPTION_DISPENSED = {'type': 'prescription', 'action': 'dispensed'}
+
+# (epoch second, ISO 8601 string) of the last formatted notification timestamp
+_TS_CACHE = [0, '']
+
+def _iso_now():
+    """Current UTC time as ISO 8601, formatted at most once per second"""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[1] = datetime.utcfromtimestamp(now).isoformat() + 'Z'
+        _TS_CACHE[0] = now
+    return _TS_CACHE[1]
+
 class RealTimeNotifications:
     """Real-time notification system"""
     
+    @staticmethod
+    def _emit(event, envelope, data, **kwargs):
+        """Fill a static envelope with data and a timestamp and emit it once"""
+        payload = dict(envelope)
+        payload['data'] = data
+        payload['timestamp'] = _iso_now()
+        socketio.emit(event, payload, **kwargs)
+    
     @staticmethod
     def notify_appointment_created(appointment_data):
         """Notify relevant users about new appointment"""
-        socketio.emit('appointment_created', {
-            'type': 'appointment',
-            'action': 'created',
-            'data': appointment_data,
-            'timestamp': datetime.utcnow().isoformat()
-        }, room=f'department_{appointment_data.get("department_id")}')
+        RealTimeNotifications._emit(
+            'appointment_created', _APPOINTMENT_CREATED, appointment_data,
+            room=f'department_{appointment_data.get("department_id")}'
+        )
     
     @staticmethod
     def notify_lab_result_ready(lab_order_data):
         """Notify about lab results being ready"""
-        socketio.emit('lab_result_ready', {
-            'type': 'lab_result',
-            'action': 'completed',
-            'data': lab_order_data,
-            'timestamp': datetime.utcnow().isoformat()
-        }, room=f'user_{lab_order_data.get("ordered_by")}')
+        RealTimeNotifications._emit(
+            'lab_result_ready', _LAB_RESULT_READY, lab_order_data,
+            room=f'user_{lab_order_data.get("ordered_by")}'
+        )
     
     @staticmethod
     def notify_emergency_alert(alert_data):
         """Broadcast emergency alerts to all connected users"""
-        socketio.emit('emergency_alert', {
-            'type': 'emergency',
-            'priority': 'high',
-            'data': alert_data,
-            'timestamp': datetime.utcnow().isoformat()
-        }, broadcast=True)
+        RealTimeNotifications._emit(
+            'emergency_alert', _EMERGENCY_ALERT, alert_data,
+            room=_ALL_USERS_ROOM
+        )
     
     @staticmethod
     def notify_prescription_dispensed(prescription_data):
         """Notify about prescription being dispensed"""
-        socketio.emit('prescription_dispensed', {
-            'type': 'prescription',
-            'action': 'dispensed',
-            'data': prescription_data,
-            'timestamp': datetime.utcnow().isoformat()
-        }, room=f'user_{prescription_data.get("doctor_id")}')
+        RealTimeNotifications._emit(
+            'prescription_dispensed', _PRESCRIPTION_DISPENSED, prescription_data,
+            room=f'user_{prescription_data.get("doctor_id")}'
+        )
 
 # Integration with Flask app
 def init_websocket(app):
     """Initialize WebSocket with Flask app"""
-    socketio.init_app(app, cors_allowed_origins="*")
+    socketio.init_app(
+        app,
+        cors_allowed_origins="*",
+        message_queue=app.config.get('SOCKETIO_MESSAGE_QUEUE')
+    )
     return socketio
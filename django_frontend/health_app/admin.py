@@ -16,3 +16,5 @@ class UserSessionAdmin(admin.ModelAdmin):
     list_filter = ('is_active', 'created_at', 'expires_at')
     search_fields = ('user__username',)
     readonly_fields = ('created_at',)
+    list_select_related = ('user',)
+    show_full_result_count = False
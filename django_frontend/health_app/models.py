@@ -33,6 +33,10 @@ class UserSession(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_active', 'created_at'], name='usersession_active_created_idx'),
+            models.Index(fields=['expires_at'], name='usersession_expires_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.created_at}"
@@ -2,50 +2,283 @@
 Service to communicate with the Flask backend API.
 """
 
+import hashlib
+import json
 import requests
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
-from typing import Dict, Any, Optional
+from django.core.cache import cache
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Most recent (token, url) GET responses kept for If-None-Match revalidation
+ETAG_CACHE_SIZE = 256
+# Successful logins remembered in-process, and for how many seconds
+LOGIN_CACHE_SIZE = 1024
+LOGIN_CACHE_TTL = 30
+# Seconds an optional endpoint that answered 404 is skipped before being retried
+MISSING_ENDPOINT_TTL = 600
+# Distinct (method, endpoint) keys tracked in request metrics before folding into 'other'
+METRICS_MAX_KEYS = 512
+# Rows per backend page (the backend's maximum) when listing every client for a picker
+CLIENT_CHOICES_PAGE_SIZE = 100
+
+
+@lru_cache(maxsize=256)
+def _auth_headers(token: str) -> Dict[str, str]:
+    """Authorization header dict for a token, built once per token
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    return {'Authorization': f'Bearer {token}'}
+
+
+def _filters(**filters) -> Optional[Dict[str, str]]:
+    """Query parameters for the non-empty list filters, or None if there are none"""
+    params = {name: value for name, value in filters.items() if value}
+    return params or None
+
+
+def _json_loads(content):
+    """Decode a JSON response body (bytes or str)"""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode a request body as JSON bytes"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+class CircuitBreaker:
+    """Fail fast after repeated connection failures instead of waiting on timeouts
+    
+    After fail_max consecutive failures the breaker opens and allow() returns
+    False for reset_timeout seconds; then a single trial request is let
+    through, and its outcome closes or re-opens the breaker.
+    """
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: let this caller probe, keep others failing fast
+                self._opened_at = time.monotonic()
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning("Flask backend circuit opened after %d failures", self._failures)
+                self._opened_at = time.monotonic()
+
 
 class FlaskBackendService:
     """Service class to handle communication with Flask backend"""
     
     def __init__(self):
         self.base_url = settings.FLASK_API_URL
+        # Seconds successful GETs are shared through Django's cache, by kind of data
+        self.reference_ttl = getattr(settings, 'FLASK_API_REFERENCE_TTL', 60)
+        self.list_ttl = getattr(settings, 'FLASK_API_LIST_TTL', 30)
+        self.analytics_ttl = getattr(settings, 'FLASK_API_ANALYTICS_TTL', 300)
+        self.dashboard_ttl = getattr(settings, 'FLASK_API_DASHBOARD_TTL', 60)
+        self.dropdown_ttl = getattr(settings, 'FLASK_API_DROPDOWN_TTL', 300)
+        # (connect, read): fail fast when Flask is unreachable, allow slower reports
+        self.timeout = (
+            getattr(settings, 'FLASK_API_CONNECT_TIMEOUT', 3),
+            getattr(settings, 'FLASK_API_READ_TIMEOUT', 10)
+        )
+        # Endpoint -> absolute URL; the endpoint set is small and fixed per view
+        self._url = lru_cache(maxsize=256)(self._build_url)
         self.session = requests.Session()
+        pool_size = getattr(settings, 'FLASK_API_POOL_SIZE', 64)
+        # Retry transient failures of idempotent requests (never POST) with jittered backoff
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=1,
+            status=3,
+            backoff_factor=0.3,
+            backoff_jitter=0.1,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=getattr(settings, 'FLASK_API_POOL_CONNECTIONS', 32),
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.breaker = CircuitBreaker(
+            fail_max=getattr(settings, 'FLASK_API_BREAKER_FAIL_MAX', 5),
+            reset_timeout=getattr(settings, 'FLASK_API_BREAKER_RESET_TIMEOUT', 30)
+        )
+        # (method, endpoint) -> [count, errors, total seconds, max seconds, bytes received]
+        self._metrics = {}
+        self._metrics_lock = threading.Lock()
+        self._slow_request_seconds = getattr(settings, 'FLASK_API_SLOW_REQUEST_SECONDS', 1.0)
+        # (token, url) -> (ETag, raw body) of recent GETs, in LRU order
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+        # (username, password digest) -> (expires at, auth result) of recent successful logins
+        self._login_cache = OrderedDict()
+        self._login_lock = threading.Lock()
+        # Worker threads for fetch_parallel; never more than the pool can serve
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(getattr(settings, 'FLASK_API_FANOUT_WORKERS', 8), pool_size),
+            thread_name_prefix='flask-api'
+        )
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
     
+    def _build_url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+    
+    def _etag_lookup(self, key):
+        """Return the cached (ETag, body) for key, marking it recently used"""
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+            if cached:
+                self._etag_cache.move_to_end(key)
+            return cached
+    
+    def _etag_store(self, key, etag: str, body: bytes) -> None:
+        """Remember a GET response body under its ETag, evicting the oldest entry"""
+        with self._etag_lock:
+            self._etag_cache[key] = (etag, body)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+    
+    def _record(self, method: str, endpoint: str, status: Optional[int],
+                elapsed: float, size: int) -> None:
+        """Accumulate latency and byte counts for one backend call"""
+        key = (method, endpoint)
+        with self._metrics_lock:
+            stats = self._metrics.get(key)
+            if stats is None:
+                if len(self._metrics) >= METRICS_MAX_KEYS:
+                    key = (method, 'other')
+                stats = self._metrics.setdefault(key, [0, 0, 0.0, 0.0, 0])
+            stats[0] += 1
+            if status is None or status >= 500:
+                stats[1] += 1
+            stats[2] += elapsed
+            stats[3] = max(stats[3], elapsed)
+            stats[4] += size
+        
+        if elapsed >= self._slow_request_seconds:
+            logger.warning(f"Slow backend call {method} {endpoint}: {elapsed:.3f}s (status {status})")
+    
+    def metrics(self) -> list:
+        """Per-endpoint call statistics, slowest total time first"""
+        with self._metrics_lock:
+            items = [(key, list(stats)) for key, stats in self._metrics.items()]
+        return sorted(
+            (
+                {
+                    'method': method,
+                    'endpoint': endpoint,
+                    'count': count,
+                    'errors': errors,
+                    'total_seconds': round(total, 4),
+                    'avg_seconds': round(total / count, 4),
+                    'max_seconds': round(slowest, 4),
+                    'bytes': size
+                }
+                for (method, endpoint), (count, errors, total, slowest, size) in items
+            ),
+            key=lambda row: row['total_seconds'],
+            reverse=True
+        )
+    
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                     token: Optional[str] = None) -> Dict[str, Any]:
+                     token: Optional[str] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make a request to the Flask backend"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = {}
+        url = self._url(endpoint)
+        # Shared per-token dict; copied before adding per-request headers
+        headers = _auth_headers(token) if token else {}
+        
+        method = method.upper()
+        etag_key = None
+        if method == 'GET':
+            etag_key = (token, url, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_lookup(etag_key) if etag_key else None
+        if cached:
+            headers = {**headers, 'If-None-Match': cached[0]}
         
-        if token:
-            headers['Authorization'] = f'Bearer {token}'
+        if not self.breaker.allow():
+            return {
+                'success': False,
+                'message': 'Backend unavailable, please try again shortly'
+            }
         
+        started = time.perf_counter()
         try:
             response = self.session.request(
-                method=method.upper(),
+                method=method,
                 url=url,
-                json=data,
+                params=params,
+                data=_json_dumps(data) if data is not None else None,
                 headers=headers,
-                timeout=30
+                timeout=self.timeout
             )
+            self._record(method, endpoint, response.status_code,
+                         time.perf_counter() - started, len(response.content))
+            
+            if response.status_code in (502, 503, 504):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            
+            if response.status_code == 304 and cached:
+                return {
+                    'success': True,
+                    'data': _json_loads(cached[1])
+                }
             
             if response.status_code == 200:
+                if etag_key and response.headers.get('ETag'):
+                    self._etag_store(etag_key, response.headers['ETag'], response.content)
                 return {
                     'success': True,
-                    'data': response.json()
+                    'data': _json_loads(response.content)
                 }
             else:
-                error_msg = response.json().get('error', 'Unknown error') if response.text else 'Request failed'
+                error_msg = _json_loads(response.content).get('error', 'Unknown error') if response.content else 'Request failed'
                 return {
                     'success': False,
                     'message': error_msg,
@@ -53,6 +286,8 @@ class FlaskBackendService:
                 }
                 
         except requests.exceptions.RequestException as e:
+            self._record(method, endpoint, None, time.perf_counter() - started, 0)
+            self.breaker.record_failure()
             logger.error(f"Request to Flask backend failed: {e}")
             return {
                 'success': False,
@@ -65,8 +300,142 @@ class FlaskBackendService:
                 'message': f'Unexpected error: {str(e)}'
             }
     
+    def _cache_generation(self, endpoint: str) -> int:
+        """Current generation of endpoint's cached responses; bumped on writes"""
+        return cache.get(f"flaskapi:gen:{endpoint}", 0)
+    
+    def invalidate(self, endpoint: str) -> None:
+        """Drop every user's cached responses for endpoint"""
+        key = f"flaskapi:gen:{endpoint}"
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr(); a fresh counter is just as new
+            cache.set(key, 1, None)
+    
+    def _cached_get(self, endpoint: str, token: str, ttl: int,
+                    params: Optional[Dict] = None, owner: Optional[str] = None) -> Dict[str, Any]:
+        """GET endpoint, caching successful responses per token and parameters
+        
+        With owner (a user id) the entry is shared by all of that user's
+        tokens, so it survives a re-login.
+        """
+        key = ":".join((
+            "flaskapi",
+            endpoint,
+            str(self._cache_generation(endpoint)),
+            f"user-{owner}" if owner else hashlib.sha256(token.encode()).hexdigest(),
+            urlencode(sorted(params.items())) if params else ""
+        ))
+        result = cache.get(key)
+        if result is None:
+            result = self._make_request('GET', endpoint, token=token, params=params)
+            if result['success']:
+                cache.set(key, result, ttl)
+        return result
+    
+    def _get(self, endpoint: str, token: str, default: Any, label: str,
+             key: Optional[str] = None, params: Optional[Dict] = None,
+             cache_ttl: Optional[int] = None, cache_owner: Optional[str] = None,
+             missing_ttl: Optional[int] = None) -> Any:
+        """GET an endpoint and return its data (or data[key]), or default on failure
+        
+        Every read-only getter below goes through here, so caching and error
+        handling for them live in one place. With cache_ttl set, successful
+        responses are shared through Django's cache for that many seconds.
+        With missing_ttl set, a 404 marks the endpoint as absent on this
+        backend and default is returned without a request for that long.
+        """
+        missing_key = f"flaskapi:missing:{endpoint}"
+        if missing_ttl and cache.get(missing_key):
+            return default
+        
+        if cache_ttl:
+            result = self._cached_get(endpoint, token, cache_ttl, params, cache_owner)
+        else:
+            result = self._make_request('GET', endpoint, token=token, params=params)
+        
+        if result['success']:
+            return result['data'].get(key, default) if key else result['data']
+        if missing_ttl and result.get('status_code') == 404:
+            cache.set(missing_key, True, missing_ttl)
+        logger.error(f"Failed to get {label}: {result.get('message')}")
+        return default
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Run fn (usually one of this service's getters) on the fan-out pool"""
+        return self._executor.submit(fn, *args, **kwargs)
+    
+    def fetch_parallel(self, specs: Iterable[Tuple[str, str, str, Optional[Dict]]],
+                       token: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Run several backend requests concurrently over the pooled session
+
+        specs is an iterable of (key, method, endpoint, data) tuples. Returns a
+        dict mapping each key to its _make_request result, so wall-clock time is
+        the slowest call rather than the sum of all of them.
+        """
+        futures = {
+            key: self._executor.submit(self._make_request, method, endpoint, data, token)
+            for key, method, endpoint, data in specs
+        }
+        return {key: future.result() for key, future in futures.items()}
+    
+    def batch(self, specs: Iterable[Tuple[str, str]], token: str) -> Dict[str, Dict[str, Any]]:
+        """Fetch several GET endpoints in a single call to the backend's /batch
+
+        specs is an iterable of (key, endpoint) pairs. Returns a dict mapping
+        each key to a _make_request-shaped result; every sub-request carries
+        its own status, so one failure does not fail the others.
+        """
+        specs = list(specs)
+        result = self._make_request(
+            'POST', 'batch',
+            data={'requests': [{'method': 'GET', 'endpoint': endpoint} for _, endpoint in specs]},
+            token=token
+        )
+        
+        if not result['success']:
+            return {key: result for key, _ in specs}
+        
+        results = {}
+        for (key, _), response in zip(specs, result['data'].get('responses', [])):
+            body = response.get('body') or {}
+            if response.get('status') == 200:
+                results[key] = {'success': True, 'data': body}
+            else:
+                results[key] = {
+                    'success': False,
+                    'message': body.get('error', 'Request failed') if isinstance(body, dict) else 'Request failed',
+                    'status_code': response.get('status')
+                }
+        return results
+    
+    @staticmethod
+    def _login_key(username: str, password: str) -> Tuple[str, str]:
+        """Cache key for a login; the password itself is never stored"""
+        return username, hashlib.blake2b(password.encode(), digest_size=16).hexdigest()
+    
+    def forget_login(self, username: str) -> None:
+        """Drop any cached logins for username, e.g. on logout"""
+        with self._login_lock:
+            for key in [key for key in self._login_cache if key[0] == username]:
+                del self._login_cache[key]
+    
     def authenticate(self, username: str, password: str) -> Dict[str, Any]:
-        """Authenticate user with Flask backend"""
+        """Authenticate user with Flask backend
+        
+        Successful logins are reused for LOGIN_CACHE_TTL seconds so bursts of
+        logins skip the backend's password hashing. Failures are never cached,
+        so every wrong password still reaches the backend's lockout checks.
+        """
+        key = self._login_key(username or '', password or '')
+        now = time.monotonic()
+        with self._login_lock:
+            cached = self._login_cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+        
         data = {
             'username': username,
             'password': password
@@ -76,58 +445,79 @@ class FlaskBackendService:
         
         if result['success']:
             user_data = result['data']
-            return {
+            auth_result = {
                 'success': True,
                 'token': user_data.get('access_token'),
                 'user': user_data.get('user', {}),
                 'message': 'Login successful'
             }
+            with self._login_lock:
+                self._login_cache[key] = (now + LOGIN_CACHE_TTL, auth_result)
+                self._login_cache.move_to_end(key)
+                if len(self._login_cache) > LOGIN_CACHE_SIZE:
+                    self._login_cache.popitem(last=False)
+            return auth_result
         else:
             return {
                 'success': False,
                 'message': result.get('message', 'Authentication failed')
             }
     
-    def get_dashboard_data(self, token: str) -> Dict[str, Any]:
+    def get_dashboard_data(self, token: str, user_id: Optional[str] = None) -> Dict[str, Any]:
         """Get dashboard data from Flask backend"""
-        result = self._make_request('GET', 'dashboard/stats', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get dashboard data: {result.get('message')}")
-            return {
-                'total_clients': 0,
-                'total_appointments': 0,
-                'total_visits': 0,
-                'recent_activities': []
-            }
+        return self._get('dashboard/stats', token, {
+            'total_clients': 0,
+            'total_appointments': 0,
+            'total_visits': 0,
+            'recent_activities': []
+        }, 'dashboard data', cache_ttl=self.dashboard_ttl, cache_owner=user_id)
     
-    def get_clients(self, token: str) -> list:
-        """Get clients list from Flask backend"""
-        result = self._make_request('GET', 'clients', token=token)
+    def get_clients(self, token: str, search: str = None, gender: str = None) -> list:
+        """Get clients list from Flask backend, filtered server-side"""
+        return self._get(
+            'clients', token, [], 'clients', key='data',
+            params=_filters(query=search, gender=gender), cache_ttl=self.list_ttl
+        )
+    
+    def get_clients_minimal(self, token: str, role: str = '') -> list:
+        """(id, label) pairs for client pickers, shared by all users of a role
         
-        if result['success']:
-            return result['data'].get('clients', [])
-        else:
-            logger.error(f"Failed to get clients: {result.get('message')}")
-            return []
+        Walks the backend's cursor pagination so every active client is
+        listed. The backend authorizes the clients list by role, so one
+        cached copy per role is safe to share. Cleared along with the
+        clients cache; an empty list is never cached.
+        """
+        key = f"flaskapi:clients_minimal:{self._cache_generation('clients')}:{role}"
+        clients = cache.get(key)
+        if clients is None:
+            clients = []
+            params = {'per_page': CLIENT_CHOICES_PAGE_SIZE, 'cursor': ''}
+            while True:
+                result = self._make_request('GET', 'clients', token=token, params=params)
+                if not result['success']:
+                    logger.error(f"Failed to get client choices: {result.get('message')}")
+                    return []
+                clients.extend(
+                    {'id': c['id'], 'label': f"{c.get('first_name', '')} {c.get('last_name', '')}"}
+                    for c in result['data'].get('data', [])
+                )
+                if not result['data'].get('next_cursor'):
+                    break
+                params = {**params, 'cursor': result['data']['next_cursor']}
+            if clients:
+                cache.set(key, clients, self.dropdown_ttl)
+        return clients
     
     def get_client(self, client_id: str, token: str) -> Optional[Dict]:
         """Get specific client from Flask backend"""
-        result = self._make_request('GET', f'clients/{client_id}', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get client {client_id}: {result.get('message')}")
-            return None
+        return self._get(f'clients/{client_id}', token, None, f'client {client_id}')
     
     def create_client(self, client_data: Dict, token: str) -> Dict[str, Any]:
         """Create new client via Flask backend"""
         result = self._make_request('POST', 'clients', data=client_data, token=token)
         
         if result['success']:
+            self.invalidate('clients')
             return {
                 'success': True,
                 'client': result['data'],
@@ -141,180 +531,118 @@ class FlaskBackendService:
     
     def get_appointments(self, token: str) -> list:
         """Get appointments list from Flask backend"""
-        result = self._make_request('GET', 'appointments', token=token)
-        
-        if result['success']:
-            return result['data'].get('appointments', [])
-        else:
-            logger.error(f"Failed to get appointments: {result.get('message')}")
-            return []
+        return self._get('appointments', token, [], 'appointments', key='data',
+                         cache_ttl=self.list_ttl)
     
-    def get_visits(self, token: str) -> list:
-        """Get visits list from Flask backend"""
-        result = self._make_request('GET', 'visits', token=token)
-        
-        if result['success']:
-            return result['data'].get('visits', [])
-        else:
-            logger.error(f"Failed to get visits: {result.get('message')}")
-            return []
+    def get_visits(self, token: str, client_id: str = None) -> list:
+        """Get visits list from Flask backend, filtered server-side"""
+        return self._get('visits', token, [], 'visits', key='data',
+                         params=_filters(client_id=client_id), cache_ttl=self.list_ttl)
     
     def get_programs(self, token: str) -> list:
         """Get programs list from Flask backend"""
-        result = self._make_request('GET', 'programs', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get programs: {result.get('message')}")
-            return []
+        return self._get('programs', token, [], 'programs', cache_ttl=self.reference_ttl)
     
     def get_staff(self, token: str) -> list:
         """Get staff list from Flask backend"""
-        result = self._make_request('GET', 'staff', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get staff: {result.get('message')}")
-            return []
+        return self._get('staff', token, [], 'staff', cache_ttl=self.reference_ttl)
     
     def get_departments(self, token: str) -> list:
         """Get departments list from Flask backend"""
-        result = self._make_request('GET', 'departments', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get departments: {result.get('message')}")
-            return []
+        return self._get('departments', token, [], 'departments', cache_ttl=self.reference_ttl)
     
     def get_medical_records(self, token: str, client_id: str = None) -> list:
         """Get medical records from Flask backend"""
-        endpoint = f'medical-records?client_id={client_id}' if client_id else 'medical-records'
-        result = self._make_request('GET', endpoint, token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get medical records: {result.get('message')}")
-            return []
+        params = {'client_id': client_id} if client_id else None
+        return self._get('medical-records', token, [], 'medical records', params=params)
     
-    def get_comprehensive_analytics(self, token: str, days: int = 30) -> Dict[str, Any]:
+    def get_comprehensive_analytics(self, token: str, days: int = 30,
+                                    user_id: Optional[str] = None) -> Dict[str, Any]:
         """Get comprehensive analytics dashboard data from Flask backend"""
-        result = self._make_request('GET', f'analytics/dashboard/comprehensive?days={days}', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get comprehensive analytics: {result.get('message')}")
-            return {}
+        return self._get(
+            'analytics/dashboard/comprehensive', token, {}, 'comprehensive analytics',
+            params={'days': days},
+            cache_ttl=self.analytics_ttl,
+            cache_owner=user_id
+        )
     
     def get_patient_flow_analytics(self, token: str, days: int = 30) -> Dict[str, Any]:
         """Get patient flow analytics from Flask backend"""
-        result = self._make_request('GET', f'analytics/patient-flow?days={days}', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get patient flow analytics: {result.get('message')}")
-            return {}
+        return self._get(
+            'analytics/patient-flow', token, {}, 'patient flow analytics',
+            params={'days': days},
+            cache_ttl=self.analytics_ttl
+        )
     
     def get_revenue_analytics(self, token: str, days: int = 30) -> Dict[str, Any]:
         """Get revenue analytics from Flask backend"""
-        result = self._make_request('GET', f'analytics/revenue?days={days}', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get revenue analytics: {result.get('message')}")
-            return {}
+        return self._get(
+            'analytics/revenue', token, {}, 'revenue analytics',
+            params={'days': days},
+            cache_ttl=self.analytics_ttl
+        )
     
     def get_clinical_quality_metrics(self, token: str, days: int = 30) -> Dict[str, Any]:
         """Get clinical quality metrics from Flask backend"""
-        result = self._make_request('GET', f'analytics/clinical-quality?days={days}', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get clinical quality metrics: {result.get('message')}")
-            return {}
+        return self._get(
+            'analytics/clinical-quality', token, {}, 'clinical quality metrics',
+            params={'days': days},
+            cache_ttl=self.analytics_ttl
+        )
     
     def get_operational_efficiency(self, token: str) -> Dict[str, Any]:
         """Get operational efficiency metrics from Flask backend"""
-        result = self._make_request('GET', 'analytics/operational-efficiency', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get operational efficiency: {result.get('message')}")
-            return {}
+        return self._get(
+            'analytics/operational-efficiency', token, {}, 'operational efficiency',
+            cache_ttl=self.analytics_ttl
+        )
     
     def get_predictive_insights(self, token: str, days: int = 90) -> Dict[str, Any]:
         """Get predictive insights from Flask backend"""
-        result = self._make_request('GET', f'analytics/predictive-insights?days={days}', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get predictive insights: {result.get('message')}")
-            return {}
+        return self._get(
+            'analytics/predictive-insights', token, {}, 'predictive insights',
+            params={'days': days},
+            cache_ttl=self.analytics_ttl
+        )
     
-    def get_lab_orders(self, token: str) -> list:
-        """Get lab orders from Flask backend"""
-        result = self._make_request('GET', 'lab-orders', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get lab orders: {result.get('message')}")
-            return []
+    def get_lab_orders(self, token: str, status: str = None, priority: str = None) -> list:
+        """Get lab orders from Flask backend, filtered server-side"""
+        return self._get(
+            'lab-orders', token, [], 'lab orders',
+            params=_filters(status=status, priority=priority)
+        )
     
     def get_medications(self, token: str) -> list:
         """Get medications from Flask backend"""
-        result = self._make_request('GET', 'medications', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get medications: {result.get('message')}")
-            return []
+        return self._get(
+            'medications', token, [], 'medications',
+            cache_ttl=self.reference_ttl, missing_ttl=MISSING_ENDPOINT_TTL
+        )
     
     def get_prescriptions(self, token: str) -> list:
         """Get prescriptions from Flask backend"""
-        result = self._make_request('GET', 'prescriptions', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get prescriptions: {result.get('message')}")
-            return []
+        return self._get('prescriptions', token, [], 'prescriptions')
     
-    def get_admissions(self, token: str) -> list:
-        """Get admissions from Flask backend"""
-        result = self._make_request('GET', 'admissions', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get admissions: {result.get('message')}")
-            return []
+    def get_admissions(self, token: str, status: str = None, admission_type: str = None) -> list:
+        """Get admissions from Flask backend, filtered server-side"""
+        return self._get(
+            'admissions', token, [], 'admissions',
+            params=_filters(status=status, admission_type=admission_type)
+        )
     
-    def get_billing(self, token: str) -> list:
-        """Get billing records from Flask backend"""
-        result = self._make_request('GET', 'billing', token=token)
-        
-        if result['success']:
-            return result['data']
-        else:
-            logger.error(f"Failed to get billing records: {result.get('message')}")
-            return []
+    def get_billing(self, token: str, status: str = None, payment_method: str = None) -> list:
+        """Get billing records from Flask backend, filtered server-side"""
+        return self._get(
+            'billing', token, [], 'billing records',
+            params=_filters(status=status, payment_method=payment_method)
+        )
     
     def create_appointment(self, appointment_data: Dict, token: str) -> Dict[str, Any]:
         """Create new appointment via Flask backend"""
         result = self._make_request('POST', 'appointments', data=appointment_data, token=token)
         
         if result['success']:
+            self.invalidate('appointments')
             return {
                 'success': True,
                 'appointment': result['data'],
@@ -331,6 +659,7 @@ class FlaskBackendService:
         result = self._make_request('POST', 'visits', data=visit_data, token=token)
         
         if result['success']:
+            self.invalidate('visits')
             return {
                 'success': True,
                 'visit': result['data'],
@@ -343,6 +672,13 @@ class FlaskBackendService:
             }
     
     def make_request(self, endpoint: str, method: str = 'GET', 
-                    data: Optional[Dict] = None, token: Optional[str] = None) -> Dict[str, Any]:
+                    data: Optional[Dict] = None, token: Optional[str] = None,
+                    params: Optional[Dict] = None) -> Dict[str, Any]:
         """Generic method to make requests to Flask backend"""
-        return self._make_request(method, endpoint, data, token)
+        return self._make_request(method, endpoint, data, token, params)
+
+
+# Shared instance: one requests.Session (and connection pool) per Django process.
+# requests.Session is safe to share for these stateless JSON calls since the
+# Authorization header is passed per request rather than stored on the session.
+flask_backend = FlaskBackendService()
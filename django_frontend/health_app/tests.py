@@ -0,0 +1,145 @@
+from unittest import mock
+
+from django.contrib import messages
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from .services import flask_backend
+from .views import cache_page_per_user
+
+
+def _client_rows(start, count):
+    return [
+        {'id': str(i), 'first_name': f'Patient{i}', 'last_name': 'Doe'}
+        for i in range(start, start + count)
+    ]
+
+
+class ClientPickerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        session = self.client.session
+        session['flask_token'] = 'token'
+        session['flask_user'] = {'id': 'u1', 'role': 'doctor'}
+        session['flask_user_id'] = 'u1'
+        session.save()
+
+    def _backend(self, pages):
+        """Stub _make_request to serve pages of clients chained by cursor"""
+        def fake(method, endpoint, data=None, token=None, params=None):
+            index = int(params['cursor'] or 0)
+            return {'success': True, 'data': {
+                'data': pages[index],
+                'next_cursor': str(index + 1) if index + 1 < len(pages) else None,
+            }}
+        return mock.patch.object(flask_backend, '_make_request', side_effect=fake)
+
+    def test_add_appointment_lists_every_client(self):
+        with self._backend([_client_rows(0, 100), _client_rows(100, 5)]) as make_request:
+            response = self.client.get(reverse('add_appointment'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['clients']), 105)
+        self.assertContains(response, '<option value="0">Patient0 Doe</option>', html=True)
+        self.assertContains(response, '<option value="104">Patient104 Doe</option>', html=True)
+        self.assertEqual(make_request.call_count, 2)
+
+    def test_empty_client_list_is_not_cached(self):
+        with self._backend([[]]):
+            self.client.get(reverse('add_appointment'))
+        with self._backend([_client_rows(0, 1)]):
+            response = self.client.get(reverse('add_appointment'))
+
+        self.assertContains(response, '<option value="0">Patient0 Doe</option>', html=True)
+
+
+class CachePagePerUserTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.renders = 0
+
+    def _request(self):
+        request = RequestFactory().get('/analytics/')
+        SessionMiddleware(lambda r: None).process_request(request)
+        MessageMiddleware(lambda r: None).process_request(request)
+        request.session['flask_user_id'] = 'u1'
+        request.session['flask_user'] = {'id': 'u1', 'role': 'doctor'}
+        return request
+
+    def _view(self, set_cookie=False):
+        @cache_page_per_user(60)
+        def view(request):
+            self.renders += 1
+            response = HttpResponse(''.join(str(m) for m in messages.get_messages(request)))
+            if set_cookie:
+                response.set_cookie('seen', '1')
+            return response
+        return view
+
+    def test_cached_page_is_reused(self):
+        view = self._view()
+        view(self._request())
+        view(self._request())
+        self.assertEqual(self.renders, 1)
+
+    def test_pending_message_bypasses_cached_page(self):
+        view = self._view()
+        view(self._request())
+
+        request = self._request()
+        messages.success(request, 'Saved')
+        response = view(request)
+
+        self.assertEqual(self.renders, 2)
+        self.assertEqual(response.content, b'Saved')
+
+    def test_response_setting_a_cookie_is_not_stored(self):
+        view = self._view(set_cookie=True)
+        view(self._request())
+        view(self._request())
+        self.assertEqual(self.renders, 2)
+
+
+class AnalyticsPageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        session = self.client.session
+        session['flask_token'] = 'token'
+        session['flask_user'] = {'id': 'u1', 'role': 'doctor'}
+        session['flask_user_id'] = 'u1'
+        session.save()
+
+    def test_backend_failure_page_is_not_cached(self):
+        failure = {'success': False, 'message': 'Backend unavailable, please try again shortly'}
+        success = {'success': True, 'data': {'total_revenue': 1250}}
+        with mock.patch.object(flask_backend, '_make_request',
+                               side_effect=[failure, success]) as make_request:
+            self.client.get(reverse('revenue_analytics'))
+            response = self.client.get(reverse('revenue_analytics'))
+
+        self.assertEqual(make_request.call_count, 2)
+        self.assertEqual(response.context['revenue_data'], {'total_revenue': 1250})
+
+
+class FilteredListTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        session = self.client.session
+        session['flask_token'] = 'token'
+        session['flask_user'] = {'id': 'u1', 'role': 'doctor'}
+        session['flask_user_id'] = 'u1'
+        session.save()
+
+    def test_clients_list_renders_filtered_backend_rows(self):
+        rows = [{'id': '1', 'first_name': 'Jane', 'last_name': 'Doe', 'gender': 'female'}]
+        page = {'success': True, 'data': {'data': rows, 'total': 1}}
+        with mock.patch.object(flask_backend, '_make_request', return_value=page) as make_request:
+            response = self.client.get(reverse('clients_list'), {'search': 'Jane', 'gender': 'female'})
+
+        self.assertEqual(make_request.call_args.kwargs['params'], {'query': 'Jane', 'gender': 'female'})
+        self.assertEqual(response.context['total_clients'], 1)
+        self.assertContains(response, 'Jane Doe')
@@ -3,34 +3,117 @@ Django views for the Health Management System frontend.
 These views handle the UI and proxy requests to the Flask backend.
 """
 
+import hashlib
 import requests
 import json
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import wraps
 from django.shortcuts import render, redirect
 from django.contrib.auth import login, logout
 # from django.contrib.auth.decorators import login_required  # Not using Django auth
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
+from django.core.cache import cache
 from django.views.decorators.http import require_http_methods
 from .models import UserSession
-from .services import FlaskBackendService
+from .services import flask_backend, _json_dumps
 
 logger = logging.getLogger(__name__)
 
+# Most backend calls a single batched api_proxy request may fan out to
+MAX_PROXY_BATCH = 10
+# Longest reporting window, in days, the analytics views will request
+MAX_ANALYTICS_DAYS = 365
+# Seconds a rendered analytics page is reused for the same user and URL
+ANALYTICS_PAGE_TTL = 60 * 5
+
+
+def _unwrap(response, key):
+    """Extract the list under key from a backend response (or the response if already a list)"""
+    try:
+        return response[key]
+    except (KeyError, TypeError):
+        return response if isinstance(response, list) else []
+
+
+def _days(request, default=30):
+    """The ?days= reporting window as an int clamped to 1..MAX_ANALYTICS_DAYS"""
+    try:
+        return max(1, min(int(request.GET.get('days', default)), MAX_ANALYTICS_DAYS))
+    except (TypeError, ValueError):
+        return default
+
+
+def _proxy_response(data, status=200):
+    """JSON response for proxied backend data, encoded with orjson when available
+
+    Proxy payloads are whole backend lists, where JsonResponse's stdlib
+    encoder is the slowest step of the request.
+    """
+    return HttpResponse(_json_dumps(data), status=status, content_type='application/json')
+
+
+def _wants_json(request):
+    """True when the caller asked for JSON (fetch/XHR) rather than an HTML page"""
+    return (request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+            or 'application/json' in request.headers.get('Accept', ''))
+
 
 def flask_auth_required(view_func):
-    """Custom decorator to check Flask authentication"""
+    """Custom decorator to check Flask authentication
+
+    Attaches the session's Flask token as request.flask_token and the
+    backend service as request.backend for the wrapped view.
+    """
+    @wraps(view_func)
     def wrapper(request, *args, **kwargs):
-        if 'flask_token' not in request.session:
+        token = request.session.get('flask_token')
+        if not token:
             messages.error(request, 'Please log in to access this page.')
             return redirect('login')
+        request.flask_token = token
+        request.backend = flask_backend
         return view_func(request, *args, **kwargs)
     return wrapper
 
 
+def cache_page_per_user(timeout):
+    """Cache a view's rendered GET response per Flask user and full URL
+
+    Admins always get a fresh render. Requests with a pending flash
+    message bypass the cache so the message is shown and consumed, and
+    pages that carry a message or set a cookie are never stored. A view
+    sets request.page_cacheable = False when it rendered a fallback (e.g.
+    the backend returned no data) so that page is not stored either.
+    Apply below flask_auth_required.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            user_id = request.session.get('flask_user_id')
+            if (request.method != 'GET' or user_id is None
+                    or request.session.get('flask_user', {}).get('role') == 'admin'
+                    or len(messages.get_messages(request))):
+                return view_func(request, *args, **kwargs)
+            
+            path = hashlib.blake2b(request.get_full_path().encode(), digest_size=16).hexdigest()
+            key = f"page:{view_func.__name__}:{user_id}:{path}"
+            response = cache.get(key)
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+                if (response.status_code == 200 and not response.cookies
+                        and getattr(request, 'page_cacheable', True)
+                        and not len(messages.get_messages(request))):
+                    cache.set(key, response, timeout)
+            return response
+        return wrapper
+    return decorator
+
+
 def home(request):
     """Home page view"""
     return render(request, 'health_app/home.html')
@@ -43,13 +126,14 @@ def login_view(request):
         password = request.POST.get('password')
         
         # Authenticate with Flask backend
-        backend_service = FlaskBackendService()
+        backend_service = flask_backend
         auth_result = backend_service.authenticate(username, password)
         
         if auth_result['success']:
             # Store the Flask token in session
             request.session['flask_token'] = auth_result['token']
             request.session['flask_user'] = auth_result['user']
+            request.session['flask_user_id'] = auth_result['user'].get('id')
             messages.success(request, 'Successfully logged in!')
             return redirect('dashboard')
         else:
@@ -63,7 +147,11 @@ def logout_view(request):
     # Clear Flask token from session
     if 'flask_token' in request.session:
         del request.session['flask_token']
+    request.session.pop('flask_user_id', None)
     if 'flask_user' in request.session:
+        username = request.session['flask_user'].get('username')
+        if username:
+            flask_backend.forget_login(username)
         del request.session['flask_user']
     
     messages.success(request, 'Successfully logged out!')
@@ -74,8 +162,9 @@ def logout_view(request):
 def dashboard(request):
     """Dashboard view"""
     # Get dashboard data from Flask backend
-    backend_service = FlaskBackendService()
-    dashboard_data = backend_service.get_dashboard_data(request.session['flask_token'])
+    dashboard_data = request.backend.get_dashboard_data(
+        request.flask_token, request.session.get('flask_user_id')
+    )
     
     context = {
         'user': request.session.get('flask_user', {}),
@@ -88,27 +177,14 @@ def dashboard(request):
 def clients_list(request):
     """Clients list view"""
     try:
-        backend_service = FlaskBackendService()
-        response = backend_service.get_clients(request.session['flask_token'])
-        
-        # Handle search and filtering
+        # Handle search and filtering (applied by the backend query)
         search = request.GET.get('search', '')
         gender = request.GET.get('gender', '')
         status = request.GET.get('status', '')
+        response = request.backend.get_clients(request.flask_token, search=search, gender=gender)
         
         # Extract clients from response
-        if isinstance(response, dict) and 'clients' in response:
-            clients = response['clients']
-        elif isinstance(response, list):
-            clients = response
-        else:
-            clients = []
-        
-        # Apply client-side filtering if needed
-        if search:
-            clients = [c for c in clients if search.lower() in f"{c.get('first_name', '')} {c.get('last_name', '')}".lower()]
-        if gender:
-            clients = [c for c in clients if c.get('gender') == gender]
+        clients = _unwrap(response, 'clients')
         
         context = {
             'clients': clients,
@@ -126,8 +202,7 @@ def clients_list(request):
 @flask_auth_required
 def client_detail(request, client_id):
     """Client detail view"""
-    backend_service = FlaskBackendService()
-    client = backend_service.get_client(client_id, request.session['flask_token'])
+    client = request.backend.get_client(client_id, request.flask_token)
     
     if not client:
         messages.error(request, 'Client not found.')
@@ -143,7 +218,6 @@ def client_detail(request, client_id):
 def add_client(request):
     """Add new client view"""
     if request.method == 'POST':
-        backend_service = FlaskBackendService()
         client_data = {
             'first_name': request.POST.get('first_name'),
             'last_name': request.POST.get('last_name'),
@@ -157,7 +231,11 @@ def add_client(request):
             'notes': request.POST.get('notes', '')
         }
         
-        result = backend_service.create_client(client_data, request.session['flask_token'])
+        result = request.backend.create_client(client_data, request.flask_token)
+        
+        # Scripted submissions get the result directly instead of a redirect and re-render
+        if _wants_json(request):
+            return JsonResponse(result, status=201 if result['success'] else 400)
         
         if result['success']:
             messages.success(request, 'Client added successfully!')
@@ -172,16 +250,10 @@ def add_client(request):
 def appointments_list(request):
     """Appointments list view"""
     try:
-        backend_service = FlaskBackendService()
-        response = backend_service.get_appointments(request.session['flask_token'])
+        response = request.backend.get_appointments(request.flask_token)
         
         # Extract appointments from response
-        if isinstance(response, dict) and 'appointments' in response:
-            appointments = response['appointments']
-        elif isinstance(response, list):
-            appointments = response
-        else:
-            appointments = []
+        appointments = _unwrap(response, 'appointments')
         
         # Handle filtering by status
         status_filter = request.GET.get('status', '')
@@ -200,15 +272,17 @@ def appointments_list(request):
 
 
 @flask_auth_required
+@cache_page_per_user(ANALYTICS_PAGE_TTL)
 def comprehensive_analytics(request):
     """Comprehensive analytics dashboard view"""
     try:
-        backend_service = FlaskBackendService()
-        token = request.session['flask_token']
-        
         # Get analytics data from Flask backend
-        days = request.GET.get('days', 30)
-        analytics_data = backend_service.get_comprehensive_analytics(token, days)
+        days = _days(request)
+        analytics_data = request.backend.get_comprehensive_analytics(
+            request.flask_token, days, request.session.get('flask_user_id')
+        )
+        # An empty payload means the backend call failed; don't cache that page
+        request.page_cacheable = bool(analytics_data)
         
         context = {
             'analytics_data': analytics_data,
@@ -223,14 +297,14 @@ def comprehensive_analytics(request):
 
 
 @flask_auth_required
+@cache_page_per_user(ANALYTICS_PAGE_TTL)
 def patient_flow_analytics(request):
     """Patient flow analytics view"""
     try:
-        backend_service = FlaskBackendService()
-        token = request.session['flask_token']
-        
-        days = request.GET.get('days', 30)
-        flow_data = backend_service.get_patient_flow_analytics(token, days)
+        days = _days(request)
+        flow_data = request.backend.get_patient_flow_analytics(request.flask_token, days)
+        # An empty payload means the backend call failed; don't cache that page
+        request.page_cacheable = bool(flow_data)
         
         context = {
             'flow_data': flow_data,
@@ -244,14 +318,14 @@ def patient_flow_analytics(request):
 
 
 @flask_auth_required
+@cache_page_per_user(ANALYTICS_PAGE_TTL)
 def revenue_analytics(request):
     """Revenue analytics view"""
     try:
-        backend_service = FlaskBackendService()
-        token = request.session['flask_token']
-        
-        days = request.GET.get('days', 30)
-        revenue_data = backend_service.get_revenue_analytics(token, days)
+        days = _days(request)
+        revenue_data = request.backend.get_revenue_analytics(request.flask_token, days)
+        # An empty payload means the backend call failed; don't cache that page
+        request.page_cacheable = bool(revenue_data)
         
         context = {
             'revenue_data': revenue_data,
@@ -265,14 +339,14 @@ def revenue_analytics(request):
 
 
 @flask_auth_required
+@cache_page_per_user(ANALYTICS_PAGE_TTL)
 def clinical_quality_metrics(request):
     """Clinical quality metrics view"""
     try:
-        backend_service = FlaskBackendService()
-        token = request.session['flask_token']
-        
-        days = request.GET.get('days', 30)
-        quality_data = backend_service.get_clinical_quality_metrics(token, days)
+        days = _days(request)
+        quality_data = request.backend.get_clinical_quality_metrics(request.flask_token, days)
+        # An empty payload means the backend call failed; don't cache that page
+        request.page_cacheable = bool(quality_data)
         
         context = {
             'quality_data': quality_data,
@@ -286,13 +360,13 @@ def clinical_quality_metrics(request):
 
 
 @flask_auth_required
+@cache_page_per_user(ANALYTICS_PAGE_TTL)
 def operational_efficiency(request):
     """Operational efficiency metrics view"""
     try:
-        backend_service = FlaskBackendService()
-        token = request.session['flask_token']
-        
-        efficiency_data = backend_service.get_operational_efficiency(token)
+        efficiency_data = request.backend.get_operational_efficiency(request.flask_token)
+        # An empty payload means the backend call failed; don't cache that page
+        request.page_cacheable = bool(efficiency_data)
         
         context = {
             'efficiency_data': efficiency_data
@@ -305,14 +379,14 @@ def operational_efficiency(request):
 
 
 @flask_auth_required
+@cache_page_per_user(ANALYTICS_PAGE_TTL)
 def predictive_insights(request):
     """Predictive insights view"""
     try:
-        backend_service = FlaskBackendService()
-        token = request.session['flask_token']
-        
-        days = request.GET.get('days', 90)
-        insights_data = backend_service.get_predictive_insights(token, days)
+        days = _days(request, 90)
+        insights_data = request.backend.get_predictive_insights(request.flask_token, days)
+        # An empty payload means the backend call failed; don't cache that page
+        request.page_cacheable = bool(insights_data)
         
         context = {
             'insights_data': insights_data,
@@ -329,21 +403,11 @@ def predictive_insights(request):
 def visits_list(request):
     """Visits list view"""
     try:
-        backend_service = FlaskBackendService()
-        response = backend_service.get_visits(request.session['flask_token'])
+        client_id = request.GET.get('client_id', '')
+        response = request.backend.get_visits(request.flask_token, client_id=client_id)
         
         # Extract visits from response
-        if isinstance(response, dict) and 'visits' in response:
-            visits = response['visits']
-        elif isinstance(response, list):
-            visits = response
-        else:
-            visits = []
-        
-        # Handle filtering
-        client_id = request.GET.get('client_id', '')
-        if client_id:
-            visits = [v for v in visits if str(v.get('client_id')) == client_id]
+        visits = _unwrap(response, 'visits')
         
         context = {
             'visits': visits,
@@ -359,8 +423,7 @@ def visits_list(request):
 @flask_auth_required
 def programs_list(request):
     """Programs list view"""
-    backend_service = FlaskBackendService()
-    programs = backend_service.get_programs(request.session['flask_token'])
+    programs = request.backend.get_programs(request.flask_token)
     
     context = {
         'programs': programs
@@ -372,7 +435,6 @@ def programs_list(request):
 def add_appointment(request):
     """Add new appointment view"""
     if request.method == 'POST':
-        backend_service = FlaskBackendService()
         appointment_data = {
             'client_id': request.POST.get('client_id'),
             'date': request.POST.get('date'),
@@ -381,7 +443,11 @@ def add_appointment(request):
             'notes': request.POST.get('notes', '')
         }
         
-        result = backend_service.create_appointment(appointment_data, request.session['flask_token'])
+        result = request.backend.create_appointment(appointment_data, request.flask_token)
+        
+        # Scripted submissions get the result directly instead of a redirect and re-render
+        if _wants_json(request):
+            return JsonResponse(result, status=201 if result['success'] else 400)
         
         if result['success']:
             messages.success(request, 'Appointment scheduled successfully!')
@@ -390,8 +456,9 @@ def add_appointment(request):
             messages.error(request, result['message'])
     
     # Get clients for dropdown
-    backend_service = FlaskBackendService()
-    clients = backend_service.get_clients(request.session['flask_token'])
+    clients = request.backend.get_clients_minimal(
+        request.flask_token, request.session.get('flask_user', {}).get('role', '')
+    )
     
     context = {
         'clients': clients
@@ -403,7 +470,6 @@ def add_appointment(request):
 def add_visit(request):
     """Add new visit view"""
     if request.method == 'POST':
-        backend_service = FlaskBackendService()
         visit_data = {
             'client_id': request.POST.get('client_id'),
             'visit_date': request.POST.get('visit_date'),
@@ -419,7 +485,11 @@ def add_visit(request):
             }
         }
         
-        result = backend_service.create_visit(visit_data, request.session['flask_token'])
+        result = request.backend.create_visit(visit_data, request.flask_token)
+        
+        # Scripted submissions get the result directly instead of a redirect and re-render
+        if _wants_json(request):
+            return JsonResponse(result, status=201 if result['success'] else 400)
         
         if result['success']:
             messages.success(request, 'Visit recorded successfully!')
@@ -428,8 +498,9 @@ def add_visit(request):
             messages.error(request, result['message'])
     
     # Get clients for dropdown
-    backend_service = FlaskBackendService()
-    clients = backend_service.get_clients(request.session['flask_token'])
+    clients = request.backend.get_clients_minimal(
+        request.flask_token, request.session.get('flask_user', {}).get('role', '')
+    )
     
     context = {
         'clients': clients
@@ -441,28 +512,31 @@ def add_visit(request):
 def staff_list(request):
     """Staff list view with enhanced error handling and filtering."""
     try:
-        backend_service = FlaskBackendService()
-        response = backend_service.get_staff(request.session['flask_token'])
+        response = request.backend.get_staff(request.flask_token)
         
         # Extract staff from response
-        if isinstance(response, dict) and 'staff' in response:
-            staff = response['staff']
-        elif isinstance(response, list):
-            staff = response
-        else:
-            staff = []
+        staff = _unwrap(response, 'staff')
         
         # Handle filtering
         department = request.GET.get('department', '')
         specialization = request.GET.get('specialization', '')
         employment_type = request.GET.get('employment_type', '')
         
-        if department:
-            staff = [s for s in staff if s.get('department_name', '').lower() == department.lower()]
-        if specialization:
-            staff = [s for s in staff if s.get('specialization', '').lower() == specialization.lower()]
-        if employment_type:
-            staff = [s for s in staff if s.get('employment_type', '').lower() == employment_type.lower()]
+        # Lower-case each filter once and apply them all in a single pass
+        wanted = [
+            (field, value.lower())
+            for field, value in (
+                ('department_name', department),
+                ('specialization', specialization),
+                ('employment_type', employment_type),
+            )
+            if value
+        ]
+        if wanted:
+            staff = [
+                s for s in staff
+                if all((s.get(field) or '').lower() == value for field, value in wanted)
+            ]
         
         context = {
             'staff': staff,
@@ -482,16 +556,10 @@ def staff_list(request):
 def departments_list(request):
     """Departments list view with enhanced error handling."""
     try:
-        backend_service = FlaskBackendService()
-        response = backend_service.get_departments(request.session['flask_token'])
+        response = request.backend.get_departments(request.flask_token)
         
         # Extract departments from response
-        if isinstance(response, dict) and 'departments' in response:
-            departments = response['departments']
-        elif isinstance(response, list):
-            departments = response
-        else:
-            departments = []
+        departments = _unwrap(response, 'departments')
         
         # Handle filtering
         location = request.GET.get('location', '')
@@ -520,17 +588,11 @@ def departments_list(request):
 def medical_records_list(request):
     """Medical records list view with enhanced error handling."""
     try:
-        backend_service = FlaskBackendService()
         client_id = request.GET.get('client_id')
-        response = backend_service.get_medical_records(request.session['flask_token'], client_id)
+        response = request.backend.get_medical_records(request.flask_token, client_id)
         
         # Extract medical records from response
-        if isinstance(response, dict) and 'medical_records' in response:
-            medical_records = response['medical_records']
-        elif isinstance(response, list):
-            medical_records = response
-        else:
-            medical_records = []
+        medical_records = _unwrap(response, 'medical_records')
         
         # Additional filtering
         date_from = request.GET.get('date_from', '')
@@ -558,25 +620,15 @@ def medical_records_list(request):
 def laboratory_list(request):
     """Laboratory/Lab orders list view with enhanced error handling."""
     try:
-        backend_service = FlaskBackendService()
-        response = backend_service.get_lab_orders(request.session['flask_token'])
-        
-        # Extract lab orders from response
-        if isinstance(response, dict) and 'lab_orders' in response:
-            lab_orders = response['lab_orders']
-        elif isinstance(response, list):
-            lab_orders = response
-        else:
-            lab_orders = []
-        
-        # Handle filtering
+        # Handle filtering (applied by the backend query)
         status = request.GET.get('status', '')
         priority = request.GET.get('priority', '')
+        response = request.backend.get_lab_orders(
+            request.flask_token, status=status.lower(), priority=priority.lower()
+        )
         
-        if status:
-            lab_orders = [l for l in lab_orders if l.get('status', '').lower() == status.lower()]
-        if priority:
-            lab_orders = [l for l in lab_orders if l.get('priority', '').lower() == priority.lower()]
+        # Extract lab orders from response
+        lab_orders = _unwrap(response, 'lab_orders')
         
         context = {
             'lab_orders': lab_orders,
@@ -595,28 +647,15 @@ def laboratory_list(request):
 def pharmacy_list(request):
     """Pharmacy view with medications and prescriptions with enhanced error handling."""
     try:
-        backend_service = FlaskBackendService()
+        # Fetch medications in the background while prescriptions load here
+        medications_future = request.backend.submit(request.backend.get_medications, request.flask_token)
         
         # Get prescriptions
-        prescriptions_response = backend_service.get_prescriptions(request.session['flask_token'])
-        if isinstance(prescriptions_response, dict) and 'prescriptions' in prescriptions_response:
-            prescriptions = prescriptions_response['prescriptions']
-        elif isinstance(prescriptions_response, list):
-            prescriptions = prescriptions_response
-        else:
-            prescriptions = []
-        
-        # Get inventory/medications
-        try:
-            medications_response = backend_service.get_medications(request.session['flask_token'])
-            if isinstance(medications_response, dict) and 'medications' in medications_response:
-                medications = medications_response['medications']
-            elif isinstance(medications_response, list):
-                medications = medications_response
-            else:
-                medications = []
-        except:
-            medications = []  # In case medications endpoint doesn't exist
+        prescriptions_response = request.backend.get_prescriptions(request.flask_token)
+        prescriptions = _unwrap(prescriptions_response, 'prescriptions')
+        
+        # Get inventory/medications; empty if this backend has no medications endpoint
+        medications = _unwrap(medications_future.result(), 'medications')
         
         # Handle filtering
         status = request.GET.get('status', '')
@@ -644,47 +683,37 @@ def pharmacy_list(request):
 def admissions_list(request):
     """Hospital admissions list view with enhanced error handling."""
     try:
-        backend_service = FlaskBackendService()
-        response = backend_service.get_admissions(request.session['flask_token'])
-        
-        # Extract admissions from response
-        if isinstance(response, dict) and 'admissions' in response:
-            admissions = response['admissions']
-        elif isinstance(response, list):
-            admissions = response
-        else:
-            admissions = []
-        
-        # Handle filtering
+        # Handle filtering (applied by the backend query)
         status = request.GET.get('status', '')
         admission_type = request.GET.get('admission_type', '')
+        response = request.backend.get_admissions(
+            request.flask_token, status=status.lower(), admission_type=admission_type.lower()
+        )
         
-        if status:
-            admissions = [a for a in admissions if a.get('status', '').lower() == status.lower()]
-        if admission_type:
-            admissions = [a for a in admissions if a.get('admission_type', '').lower() == admission_type.lower()]
+        # Extract admissions from response
+        admissions = _unwrap(response, 'admissions')
         
         # Calculate statistics
+        status_counts = Counter(a.get('status') for a in admissions)
         stats = {
             'total_admissions': len(admissions),
-            'current_inpatients': len([a for a in admissions if a.get('status') == 'active']),
+            'current_inpatients': status_counts['active'],
             'discharges_today': 0,  # Would need date filtering
-            'pending_discharges': len([a for a in admissions if a.get('status') == 'pending'])
+            'pending_discharges': status_counts['pending']
         }
         
         context = {
             'admissions': admissions,
             'status': status,
             'admission_type': admission_type,
-            'stats': stats,
-            'total_admissions': len(admissions)
+            'stats': stats
         }
         return render(request, 'health_app/admissions/list.html', context)
     except Exception as e:
         logger.error(f"Error loading admissions: {e}")
         messages.error(request, f'Error loading admissions: {str(e)}')
         return render(request, 'health_app/admissions/list.html', {
-            'admissions': [], 'total_admissions': 0, 
+            'admissions': [],
             'stats': {'total_admissions': 0, 'current_inpatients': 0, 'discharges_today': 0, 'pending_discharges': 0}
         })
 
@@ -693,30 +722,24 @@ def admissions_list(request):
 def billing_list(request):
     """Billing and invoices list view with enhanced error handling."""
     try:
-        backend_service = FlaskBackendService()
-        response = backend_service.get_billing(request.session['flask_token'])
-        
-        # Extract billing records from response
-        if isinstance(response, dict) and 'billing_records' in response:
-            billing_records = response['billing_records']
-        elif isinstance(response, list):
-            billing_records = response
-        else:
-            billing_records = []
-        
-        # Handle filtering
+        # Handle filtering (applied by the backend query)
         status = request.GET.get('status', '')
         payment_method = request.GET.get('payment_method', '')
+        response = request.backend.get_billing(
+            request.flask_token, status=status.lower(), payment_method=payment_method.lower()
+        )
         
-        if status:
-            billing_records = [b for b in billing_records if b.get('status', '').lower() == status.lower()]
-        if payment_method:
-            billing_records = [b for b in billing_records if b.get('payment_method', '').lower() == payment_method.lower()]
+        # Extract billing records from response
+        billing_records = _unwrap(response, 'billings')
         
-        # Calculate statistics
-        total_amount = sum(float(b.get('total_amount', 0)) for b in billing_records)
-        paid_amount = sum(float(b.get('paid_amount', 0)) for b in billing_records)
-        pending_bills = len([b for b in billing_records if b.get('status') == 'pending'])
+        # Calculate statistics in a single pass
+        total_amount = paid_amount = 0.0
+        pending_bills = 0
+        for bill in billing_records:
+            total_amount += float(bill.get('total_amount', 0))
+            paid_amount += float(bill.get('paid_amount', 0))
+            if bill.get('status') == 'pending':
+                pending_bills += 1
         
         context = {
             'billing_records': billing_records,
@@ -747,6 +770,10 @@ def api_proxy(request):
     if 'flask_token' not in request.session:
         return JsonResponse({'error': 'Not authenticated'}, status=401)
     try:
+        # Batch mode: run several backend calls concurrently in one round trip
+        if 'endpoints' in request.POST:
+            return _api_proxy_batch(request)
+        
         # Get the target endpoint from request
         endpoint = request.POST.get('endpoint')
         method = request.POST.get('method', 'GET')
@@ -755,7 +782,7 @@ def api_proxy(request):
         if not endpoint:
             return JsonResponse({'error': 'Endpoint parameter is required'}, status=400)
         
-        backend_service = FlaskBackendService()
+        backend_service = flask_backend
         result = backend_service.make_request(
             endpoint=endpoint,
             method=method,
@@ -763,9 +790,54 @@ def api_proxy(request):
             token=request.session['flask_token']
         )
         
-        return JsonResponse(result)
+        return _proxy_response(result)
     except json.JSONDecodeError:
         return JsonResponse({'error': 'Invalid JSON data'}, status=400)
     except Exception as e:
         logger.error(f"API proxy error: {e}")
         return JsonResponse({'error': 'Internal server error'}, status=500)
+
+
+def _proxy_call_error(call):
+    """Why a batched proxy call is malformed, or None if it is valid"""
+    if not isinstance(call, dict):
+        return 'each call must be an object'
+    if not isinstance(call.get('endpoint'), str) or not call['endpoint']:
+        return 'endpoint must be a non-empty string'
+    if not isinstance(call.get('method', 'GET'), str):
+        return 'method must be a string'
+    if call.get('data') is not None and not isinstance(call['data'], dict):
+        return 'data must be an object'
+    return None
+
+
+def _api_proxy_batch(request):
+    """Proxy a JSON list of {endpoint, method, data} calls; results keep request order"""
+    calls = json.loads(request.POST['endpoints'])
+    if not isinstance(calls, list) or not calls:
+        return JsonResponse({'error': 'endpoints must be a non-empty list'}, status=400)
+    if len(calls) > MAX_PROXY_BATCH:
+        return JsonResponse({'error': f'At most {MAX_PROXY_BATCH} endpoints per batch'}, status=400)
+    for index, call in enumerate(calls):
+        error = _proxy_call_error(call)
+        if error:
+            return JsonResponse({'error': f'Call {index}: {error}'}, status=400)
+    
+    results = flask_backend.fetch_parallel(
+        (
+            (index, call.get('method', 'GET').upper(), call['endpoint'], call.get('data'))
+            for index, call in enumerate(calls)
+        ),
+        token=request.session['flask_token']
+    )
+    return _proxy_response({'results': [results[index] for index in range(len(calls))]})
+
+
+@require_http_methods(["GET"])
+def backend_metrics(request):
+    """Per-endpoint latency and byte counts for calls this process made to Flask"""
+    if 'flask_token' not in request.session:
+        return JsonResponse({'error': 'Not authenticated'}, status=401)
+    if request.session.get('flask_user', {}).get('role') != 'admin':
+        return JsonResponse({'error': 'Forbidden'}, status=403)
+    return JsonResponse({'endpoints': flask_backend.metrics()})
@@ -36,7 +36,11 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Compress rendered pages; Django 4.2 pads the output against BREACH
+    'django.middleware.gzip.GZipMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    # ETag every page from its rendered content and answer repeat GETs with 304
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -73,6 +77,21 @@ DATABASES = {
     }
 }
 
+# Cache - Redis when REDIS_URL is set so all workers share cached backend data
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -115,6 +134,27 @@ AUTH_USER_MODEL = 'health_app.CustomUser'
 # Flask Backend Configuration
 FLASK_BACKEND_URL = os.getenv('FLASK_BACKEND_URL', 'http://localhost:8000')
 FLASK_API_URL = f"{FLASK_BACKEND_URL}/api"
+# Keep-alive pool for the Django -> Flask hop; size to the number of worker threads
+FLASK_API_POOL_CONNECTIONS = int(os.getenv('FLASK_API_POOL_CONNECTIONS', '32'))
+FLASK_API_POOL_SIZE = int(os.getenv('FLASK_API_POOL_SIZE', '64'))
+# Seconds to wait for the TCP connect and for each read from the backend
+FLASK_API_CONNECT_TIMEOUT = float(os.getenv('FLASK_API_CONNECT_TIMEOUT', '3'))
+FLASK_API_READ_TIMEOUT = float(os.getenv('FLASK_API_READ_TIMEOUT', '10'))
+# Threads used to fan out independent backend calls within one Django request
+FLASK_API_FANOUT_WORKERS = int(os.getenv('FLASK_API_FANOUT_WORKERS', '8'))
+# Seconds backend responses are cached: reference data (programs, staff,
+# departments, medications), client lists, analytics reports and dashboard stats
+FLASK_API_REFERENCE_TTL = int(os.getenv('FLASK_API_REFERENCE_TTL', '60'))
+FLASK_API_LIST_TTL = int(os.getenv('FLASK_API_LIST_TTL', '30'))
+FLASK_API_ANALYTICS_TTL = int(os.getenv('FLASK_API_ANALYTICS_TTL', '300'))
+FLASK_API_DASHBOARD_TTL = int(os.getenv('FLASK_API_DASHBOARD_TTL', '60'))
+# Seconds the trimmed client list behind appointment/visit pickers is cached
+FLASK_API_DROPDOWN_TTL = int(os.getenv('FLASK_API_DROPDOWN_TTL', '300'))
+# Circuit breaker: fail fast for RESET_TIMEOUT seconds after FAIL_MAX consecutive failures
+FLASK_API_BREAKER_FAIL_MAX = int(os.getenv('FLASK_API_BREAKER_FAIL_MAX', '5'))
+FLASK_API_BREAKER_RESET_TIMEOUT = int(os.getenv('FLASK_API_BREAKER_RESET_TIMEOUT', '30'))
+# Backend calls at least this slow (seconds) are logged as warnings
+FLASK_API_SLOW_REQUEST_SECONDS = float(os.getenv('FLASK_API_SLOW_REQUEST_SECONDS', '1.0'))
 
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
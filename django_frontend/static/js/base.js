@@ -0,0 +1,20 @@
+// Active navigation highlighting
+$(document).ready(function() {
+    var currentPath = window.location.pathname;
+    $('.sidebar .nav-link').each(function() {
+        var href = $(this).attr('href');
+        if (href && currentPath.includes(href.replace('#', ''))) {
+            $(this).addClass('active');
+        }
+    });
+});
+
+// Search functionality
+$('.search-form').on('submit', function(e) {
+    e.preventDefault();
+    var searchTerm = $(this).find('input').val();
+    if (searchTerm.trim()) {
+        // Implement search functionality
+        console.log('Searching for:', searchTerm);
+    }
+});
@@ -12,9 +12,9 @@ from pathlib import Path
 backend_path = Path(__file__).parent / "backend"
 sys.path.insert(0, str(backend_path))
 
-from werkzeug.security import generate_password_hash
 from backend import create_app, db
 from backend.models import User
+from backend.utils.helpers import generate_secure_hash
 from backend.config import Config
 import logging
 
@@ -53,11 +53,7 @@ def create_admin_user():
             logger.info(f"Creating admin user: {admin_username}")
             
             # Hash the password
-            hashed_password = generate_password_hash(
-                admin_password,
-                method='pbkdf2:sha256',
-                salt_length=32
-            )
+            hashed_password = generate_secure_hash(admin_password)
             
             # Create admin user
             admin_user = User(
@@ -91,7 +87,7 @@ def verify_admin_login():
     
     with app.app_context():
         try:
-            from werkzeug.security import check_password_hash
+            from backend.utils.helpers import verify_secure_hash
             
             admin_username = os.getenv('DEFAULT_ADMIN_USERNAME', 'admin')
             admin_password = os.getenv('DEFAULT_ADMIN_PASSWORD', 'admin123')
@@ -106,7 +102,7 @@ def verify_admin_login():
                 logger.error("❌ Admin user is not active")
                 return False
                 
-            if not check_password_hash(user.password, admin_password):
+            if not verify_secure_hash(user.password, admin_password):
                 logger.error("❌ Admin password verification failed")
                 return False
                 
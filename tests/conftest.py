@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+from datetime import date
+
+import jwt
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import create_app, db
+from backend.models import Client, User
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv('FLASK_ENV', 'testing')
+    monkeypatch.setenv('DATABASE_TEST_URL', f"sqlite:///{tmp_path / 'test.db'}")
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def auth_headers(app):
+    """Authorization header for a freshly created admin user"""
+    user = User(username='tester', email='tester@example.com', password='x', role='admin')
+    db.session.add(user)
+    db.session.commit()
+    now = int(time.time())
+    token = jwt.encode(
+        {'sub': user.id, 'role': user.role, 'iat': now, 'exp': now + 300},
+        app.config['JWT_SECRET_KEY'], algorithm='HS256'
+    )
+    return {'Authorization': f'Bearer {token}'}
+
+
+@pytest.fixture
+def add_client(app):
+    """Factory that commits a client with the given name and returns it"""
+    def add(first_name, last_name='Doe'):
+        client = Client(
+            first_name=first_name, last_name=last_name, dob=date(1990, 1, 1),
+            gender='female', phone='+254700000000'
+        )
+        db.session.add(client)
+        db.session.commit()
+        return client
+    return add
@@ -2,13 +2,23 @@
 import streamlit as st
 import requests
 
+
+@st.cache_resource
+def get_http_session():
+    # One pooled session per process so reruns reuse keep-alive connections
+    return requests.Session()
+
+
 st.title("Login Test")
 
-username = st.text_input("Username")
-password = st.text_input("Password", type="password")
+# Inside a form, typing does not rerun the script; only submitting does
+with st.form("login_form"):
+    username = st.text_input("Username")
+    password = st.text_input("Password", type="password")
+    submitted = st.form_submit_button("Login")
 
-if st.button("Login"):
-    response = requests.post(
+if submitted:
+    response = get_http_session().post(
         "http://localhost:8000/api/auth/login",
         json={"username": username, "password": password}
     )
@@ -16,4 +26,4 @@ if st.button("Login"):
         st.success("Login successful!")
         st.json(response.json())
     else:
-        st.error(f"Login failed: {response.json().get('error')}")
\ No newline at end of file
+        st.error(f"Login failed: {response.json().get('error')}")
@@ -0,0 +1,50 @@
+from flask import g, jsonify, request
+
+
+def _whoami():
+    seen = getattr(g, 'batch_marker', None)
+    g.batch_marker = True
+    return jsonify(remote_addr=request.remote_addr, g_leaked=seen is not None)
+
+
+def test_sub_requests_keep_caller_address_and_isolated_g(app, client, auth_headers):
+    app.add_url_rule('/api/test/whoami', 'test_whoami', _whoami)
+
+    response = client.post(
+        '/api/batch',
+        json={'requests': [{'endpoint': 'test/whoami'}, {'endpoint': 'test/whoami'}]},
+        headers=auth_headers,
+        environ_base={'REMOTE_ADDR': '203.0.113.7'}
+    )
+
+    assert response.status_code == 200
+    bodies = [item['body'] for item in response.get_json()['responses']]
+    assert [body['remote_addr'] for body in bodies] == ['203.0.113.7', '203.0.113.7']
+    assert [body['g_leaked'] for body in bodies] == [False, False]
+
+
+def test_authenticated_endpoints_share_the_callers_connection(app, client, auth_headers, add_client):
+    add_client('Jane')
+
+    response = client.post(
+        '/api/batch',
+        json={'requests': [{'endpoint': 'clients/'}, {'endpoint': 'clients/'}]},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    for item in response.get_json()['responses']:
+        assert item['status'] == 200
+        assert [c['first_name'] for c in item['body']['data']] == ['Jane']
+
+
+def test_unslashed_endpoints_follow_the_canonical_route(app, client, auth_headers, add_client):
+    add_client('Jane')
+
+    response = client.post(
+        '/api/batch',
+        json={'requests': [{'endpoint': 'clients'}, {'endpoint': 'clients?gender=female'}]},
+        headers=auth_headers
+    )
+
+    assert [item['status'] for item in response.get_json()['responses']] == [200, 200]
@@ -0,0 +1,13 @@
+def _search(client, auth_headers, query):
+    response = client.get('/api/clients/', query_string={'query': query}, headers=auth_headers)
+    assert response.status_code == 200
+    return sorted(c['first_name'] + ' ' + c['last_name'] for c in response.get_json()['data'])
+
+
+def test_full_name_search(app, client, auth_headers, add_client):
+    add_client('Jane', 'Doe')
+    add_client('John', 'Smith')
+
+    assert _search(client, auth_headers, 'Jane Doe') == ['Jane Doe']
+    assert _search(client, auth_headers, 'jane d') == ['Jane Doe']
+    assert _search(client, auth_headers, 'Smith') == ['John Smith']
@@ -0,0 +1,30 @@
+from flask import jsonify
+
+
+def _add_large_json_route(app):
+    # Large enough to pass COMPRESS_MIN_SIZE
+    app.add_url_rule('/test/large', 'test_large', lambda: jsonify(items=list(range(2000))))
+
+
+def test_gzip_response_revalidates_with_304(app, client):
+    _add_large_json_route(app)
+
+    first = client.get('/test/large', headers={'Accept-Encoding': 'gzip'})
+    assert first.status_code == 200
+    assert first.headers['Content-Encoding'] == 'gzip'
+    etag = first.headers['ETag']
+    assert etag.endswith(':gzip"')
+
+    second = client.get('/test/large', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert second.status_code == 304
+    assert second.data == b''
+
+
+def test_uncompressed_response_revalidates_with_304(app, client):
+    _add_large_json_route(app)
+
+    first = client.get('/test/large')
+    assert 'Content-Encoding' not in first.headers
+
+    second = client.get('/test/large', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 304
@@ -0,0 +1,36 @@
+import base64
+import json
+
+import pytest
+
+from backend.utils.helpers import decode_cursor, encode_cursor
+
+
+def _raw_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(['2024-01-15T10:30:00', 'abc'])) == ['2024-01-15T10:30:00', 'abc']
+
+
+@pytest.mark.parametrize('values', [{'a': 1}, [['x'], 'id'], ['2024-01-15', {'id': 1}]])
+def test_non_scalar_cursor_values_rejected(values):
+    with pytest.raises(ValueError):
+        decode_cursor(_raw_cursor(values))
+
+
+def test_non_scalar_cursor_returns_400(app, client, auth_headers):
+    response = client.get(
+        '/api/clients/', query_string={'cursor': _raw_cursor([['x'], 'id'])}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+def test_deep_offset_page_points_to_cursor(app, client, auth_headers):
+    response = client.get(
+        '/api/clients/', query_string={'page': 1000, 'per_page': 100}, headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert response.get_json()['use'] == 'cursor'
+    assert response.get_json()['cursor_url'].endswith('/api/clients/?cursor=')
@@ -0,0 +1,29 @@
+from datetime import date, datetime
+
+from backend.utils.helpers import parse_date, parse_datetime
+
+
+def test_detected_formats(app):
+    assert parse_date('2024-01-15') == date(2024, 1, 15)
+    assert parse_date('01/15/2024') == date(2024, 1, 15)
+    assert parse_datetime('2024-01-15T10:30:00') == datetime(2024, 1, 15, 10, 30)
+
+
+def test_day_first_falls_back_to_dateutil(app):
+    assert parse_date('15/01/2024') == date(2024, 1, 15)
+
+
+def test_odd_formats_fall_back_to_dateutil(app):
+    assert parse_date('January 15, 2024') == date(2024, 1, 15)
+    assert parse_date('15 Jan 2024') == date(2024, 1, 15)
+    assert parse_datetime('2024-01-15 10:30') == datetime(2024, 1, 15, 10, 30)
+
+
+def test_explicit_format_falls_back_to_dateutil(app):
+    assert parse_date('2024-01-15', format='%d.%m.%Y') == date(2024, 1, 15)
+    assert parse_date('15.01.2024', format='%d.%m.%Y') == date(2024, 1, 15)
+
+
+def test_unparseable_returns_none(app):
+    assert parse_date('not a date') is None
+    assert parse_datetime(None) is None
@@ -0,0 +1,18 @@
+from backend.models import Client
+from backend.utils.helpers import paginate_query_cached
+
+
+def _names(clients):
+    return [client.first_name for client in clients]
+
+
+def test_commit_invalidates_cached_page(app, add_client):
+    add_client('Jane')
+    query = Client.query.order_by(Client.first_name)
+
+    first = paginate_query_cached(query, 1, 20, _names, 'test')
+    assert first['items'] == ['Jane']
+
+    add_client('Amy')
+    second = paginate_query_cached(query, 1, 20, _names, 'test')
+    assert second['items'] == ['Amy', 'Jane']
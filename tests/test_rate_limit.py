@@ -0,0 +1,16 @@
+import time
+
+from backend.utils import rate_limit
+
+
+def test_denials_never_exceed_the_cap(monkeypatch):
+    monkeypatch.setattr(rate_limit, '_denied_until', rate_limit.OrderedDict())
+    monkeypatch.setattr(rate_limit, '_MAX_DENIED_ENTRIES', 3)
+    reset_at = time.time() + 86400
+
+    for i in range(5):
+        rate_limit.remember_denial(f'key{i}', reset_at)
+
+    assert list(rate_limit._denied_until) == ['key2', 'key3', 'key4']
+    assert rate_limit.denial_retry_after('key0') == 0
+    assert rate_limit.denial_retry_after('key4') > 0